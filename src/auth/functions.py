@@ -13,8 +13,12 @@ from typing import Annotated, List
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
+import models
 from utils import common_responses, environ_variable_tools as environ
+from utils.db import get_db
 import schemas
 
 
@@ -50,13 +54,15 @@ def validate_user(
     token: Annotated[
         str,
         Depends(OAuth2PasswordBearer(tokenUrl="api/login"))
-    ]
+    ],
+    db_session: Session = Depends(get_db)
 ):
     """
     This function validates user and returns the user email. 
 
     Parameters:
     - token (str): Jason Web Token.
+    - db_session: an sqlalchemy db Session to query the database.
 
     Returns: 
     - dict: {"email": user email}.
@@ -66,6 +72,7 @@ def validate_user(
     """
 
     jwt_payload = get_jwt_payload(token)
+    user_id: int = jwt_payload.get("id")
     user_email: str = jwt_payload.get("email")
     active: bool = jwt_payload.get("active")
     permissions: List[str] = jwt_payload.get("permissions")
@@ -73,7 +80,18 @@ def validate_user(
     if user_email is None or permissions is None:
         raise common_responses.invalid_credentials()
 
-    token_data = schemas.TokenData(
+    # Tokens don't expire, so the user may have been deleted since the token was
+    # issued. Tokens issued before the id was added to the payload use the email.
+    user_id = db_session.scalar(select(models.User.id).where(
+        models.User.id == user_id if user_id is not None
+        else models.User.email == user_email
+    ))
+    if user_id is None:
+        raise common_responses.invalid_credentials()
+
+    # The payload was signed by the API, so it doesn't need validating again
+    token_data = schemas.TokenData.model_construct(
+        user_id=user_id,
         email=user_email,
         is_admin="admin" in permissions,
         is_master="master" in permissions,
@@ -87,13 +105,15 @@ def validate_admin_user(
     token: Annotated[
         str,
         Depends(OAuth2PasswordBearer(tokenUrl="api/login"))
-    ]
+    ],
+    db_session: Session = Depends(get_db)
 ):
     """
     This function validates an admin user and returns the user email. 
 
     Parameters:
     - token (str): Jason Web Token.
+    - db_session: an sqlalchemy db Session to query the database.
 
     Returns: 
     - dict: {"email": user email}.
@@ -102,7 +122,7 @@ def validate_admin_user(
     - HTTPException (401): if user is not valid, or user is not admin.
     """
 
-    token_data = validate_user(token)
+    token_data = validate_user(token, db_session)
 
     if not token_data.is_admin or not token_data.is_active:
         raise common_responses.invalid_credentials()
@@ -114,13 +134,15 @@ def validate_master_user(
     token: Annotated[
         str,
         Depends(OAuth2PasswordBearer(tokenUrl="api/login"))
-    ]
+    ],
+    db_session: Session = Depends(get_db)
 ):
     """
     This function validates a master user and returns the user email. 
 
     Parameters:
     - token (str): Jason Web Token.
+    - db_session: an sqlalchemy db Session to query the database.
 
     Returns: 
     - dict: {"email": user email}.
@@ -130,7 +152,7 @@ def validate_master_user(
       or user is not master.
     """
 
-    token_data = validate_admin_user(token)
+    token_data = validate_admin_user(token, db_session)
 
     if not token_data.is_master:
         raise common_responses.invalid_credentials()
@@ -5,16 +5,18 @@ Usage:
 - Import the required function and call it.
 """
 from datetime import datetime
+from functools import lru_cache
 import math
-from typing import List, Any
+from threading import Lock
+from time import monotonic
+from typing import List, Any, Dict, Optional
 
 from fastapi import HTTPException, status
 import pytz
-from sqlalchemy import and_, not_, or_
+from sqlalchemy import and_, not_, or_, select
 from sqlalchemy.orm import Session, Query
 
 import models
-from utils import common_responses
 from functions.navigation import (
     find_nearby_aerodromes,
     find_aerodromes_within_radius,
@@ -22,6 +24,7 @@ from functions.navigation import (
 )
 
 
+@lru_cache(maxsize=4096)
 def clean_string(input_string: str) -> str:
     '''
     This functions takes a string and clens it by:
@@ -29,44 +32,99 @@ def clean_string(input_string: str) -> str:
     - Converts to lowercase and capitalizes first letter.
     - Replaces consecutive white spaces with a single space.
 
+    Results are cached, as the same names and surfaces get cleaned repeatedly.
+
     Parameters:
     - input_string (str): string to be cleaned.
 
     Returns:
     str: cleaned string.
     '''
-    list_by_space = [word.capitalize()
-                     for word in input_string.strip().split()]
-    new_list = []
-    for sub_string in list_by_space:
-        list_by_slash = [word.capitalize() for word in sub_string.split("/")]
-        new_list.append('/'.join(list_by_slash))
+    return ' '.join(
+        '/'.join(sub_string.capitalize() for sub_string in word.split("/"))
+        for word in input_string.split()
+    )
+
+
+def round_two_decimals(value: float) -> float:
+    '''
+    This function rounds a float to 2 decimal places. 
+    It's used as an AfterValidator in the pydantic schemas.
+
+    Parameters:
+    - value (float): value to be rounded.
+
+    Returns:
+    float: rounded value.
+    '''
+    return round(value, 2)
+
+
+def to_upper_case(value: Any) -> Any:
+    '''
+    This function strips and upper-cases string values, and leaves any other value
+    untouched. It's used as a BeforeValidator in the pydantic schemas.
+
+    Parameters:
+    - value (Any): value to be upper-cased.
+
+    Returns:
+    Any: upper-cased string, or the original value.
+    '''
+    return value.strip().upper() if isinstance(value, str) else value
 
-    return ' '.join(new_list)
 
+# The aerodrome status table only changes through the admin endpoints,
+# so the list is cached in memory and those endpoints clear it. The cache
+# lives in each worker process, so it also expires after a short TTL, for
+# the other workers to pick up changes made through a different worker.
+_AERODROME_STATUS_CACHE_TTL_SECONDS = 60
+_aerodrome_status_cache: Dict[str, Any] = {"generation": 0, "list": None, "expires_at": 0.0}
+_aerodrome_status_lock = Lock()
 
-def get_user_id_from_email(email: str, db_session: Session):
+
+def get_aerodrome_status_list(db_session: Session) -> List[Dict[str, Any]]:
     """
-    This method queries the db for the user with the provided email, 
-    and returns the user id.
+    This function returns all the aerodrome status ordered by status, 
+    from memory if possible, or from the database otherwise.
 
     Parameters:
-    - email (str): the user email.
     - db_session: an sqlalchemy db Session to query the database.
 
     Returns: 
-    - int: the user id.
-
-    Raises:
-    - HTTPException (401): if it doesn't find a user with the provided email.
-    - HTTPException (500): if there is a server error. 
+    - list: list of dictionaries with the status id and status.
     """
-    user_id = db_session.query(models.User.id).filter(
-        models.User.email == email).first()
-    if not user_id:
-        raise common_responses.invalid_credentials()
-
-    return user_id[0]
+    with _aerodrome_status_lock:
+        status_list: Optional[List[Dict[str, Any]]] = _aerodrome_status_cache["list"]
+        generation = _aerodrome_status_cache["generation"]
+        expires_at = _aerodrome_status_cache["expires_at"]
+    if status_list is not None and monotonic() < expires_at:
+        return status_list
+
+    status_list = [{"id": status_id, "status": status_name} for status_id, status_name in
+                   db_session.execute(
+                       select(models.AerodromeStatus.id, models.AerodromeStatus.status)
+                       .order_by(models.AerodromeStatus.status)
+                   ).all()]
+
+    # Don't cache the list if it was cleared while querying the database
+    with _aerodrome_status_lock:
+        if _aerodrome_status_cache["generation"] == generation:
+            _aerodrome_status_cache["list"] = status_list
+            _aerodrome_status_cache["expires_at"] = \
+                monotonic() + _AERODROME_STATUS_CACHE_TTL_SECONDS
+
+    return status_list
+
+
+def clear_aerodrome_status_cache() -> None:
+    """
+    This function clears the cached aerodrome status list. 
+    Call it after changing the aerodrome status table.
+    """
+    with _aerodrome_status_lock:
+        _aerodrome_status_cache["generation"] += 1
+        _aerodrome_status_cache["list"] = None
 
 
 def runways_are_unique(runways: List[Any]):
@@ -9,7 +9,7 @@ from typing import List, Dict, Tuple, Union
 
 from fastapi import HTTPException, status
 import numpy as np
-from sqlalchemy import and_, Row
+from sqlalchemy import and_, or_, Row
 from sqlalchemy.orm import Session
 
 from functions import aircraft_performance
@@ -17,6 +17,76 @@ import models
 from utils.config import get_constant
 
 
+def _unit_vector(lat: float, lon: float) -> np.ndarray:
+    """
+    This function returns the cartesian unit vector of a latitude and longitude in radians.
+    """
+    return np.array([math.cos(lat) * math.cos(lon),
+                     math.cos(lat) * math.sin(lon),
+                     math.sin(lat)])
+
+
+def _dms_unit_vector(lat: List[int], lon: List[int]) -> np.ndarray:
+    """
+    This function returns the cartesian unit vector of a latitude 
+    and longitude in [degrees, minutes, seconds].
+    """
+    return _unit_vector(
+        lat=math.radians(lat[0] + (lat[1] + lat[2] / 60) / 60),
+        lon=math.radians(lon[0] + (lon[1] + lon[2] / 60) / 60)
+    )
+
+
+# Northern Domestic Airspace boundary
+_NDA_CEIL_LAT = math.radians(72)
+_NDA_FLOOR_LAT = math.radians(58 + 46/60)
+_NDA_REF_POINT = _dms_unit_vector(lat=[80, 0, 0], lon=[-90, -0, -0])
+_NDA_BOUNDARY_POINTS = [
+    _dms_unit_vector(lat=[69, 0, 0], lon=[-141, -0, -0]),
+    _dms_unit_vector(lat=[72, 0, 0], lon=[-129, -0, -0]),
+    _dms_unit_vector(lat=[67, 40, 22], lon=[-129, -29, -34]),
+    _dms_unit_vector(lat=[63, 11, 21], lon=[-115, -19, -22]),
+    _dms_unit_vector(lat=[62, 10, 55], lon=[-112, -45, -20]),
+    _dms_unit_vector(lat=[59, 0, 30], lon=[-95, -29, -15]),
+    _dms_unit_vector(lat=[58, 46, 0], lon=[-92, -21, -0]),
+    _dms_unit_vector(lat=[62, 6, 47], lon=[-79, -11, -59]),
+    _dms_unit_vector(lat=[62, 34, 13], lon=[-76, -31, -52]),
+    _dms_unit_vector(lat=[63, 26, 30], lon=[-69, -53, -30]),
+    _dms_unit_vector(lat=[64, 14, 23], lon=[-67, -34, -28]),
+    _dms_unit_vector(lat=[67, 31, 57], lon=[-60, -18, -13]),
+]
+_NDA_BOUNDARY_ARCS = [
+    {
+        "center": _unit_vector(
+            lat=math.radians(62 + (27 + 52/60)/60),
+            lon=math.radians(-114 - (26 + 12/60)/60)
+        ),
+        "radius": 50
+    },
+    {
+        "center": _unit_vector(
+            lat=math.radians(58 + (45 + 45/60)/60),
+            lon=math.radians(-93 - (57 + 14/60)/60)
+        ),
+        "radius": 50
+    },
+    {
+        "center": _unit_vector(
+            lat=math.radians(62 + (24 + 49/60)/60),
+            lon=math.radians(-77 - (55 + 38/60)/60)
+        ),
+        "radius": 40
+    },
+    {
+        "center": _unit_vector(
+            lat=math.radians(63 + (44)/60),
+            lon=math.radians(-68 - (32 + 53/60)/60)
+        ),
+        "radius": 40
+    },
+]
+
+
 def round_altitude_to_nearest_hundred(min_altitude: int) -> int:
     """
     This function rounds a minimum flying altitude to its next hundred, 
@@ -536,6 +606,254 @@ def location_coordinate(lat_deg: float, lon_deg: float, strict: bool = False) ->
     return location
 
 
+def coordinate_to_radians(degrees: int, minutes: int, seconds: int, direction: str) -> float:
+    """
+    This function converts a latitude or longitude in degrees, minutes, 
+    seconds and direction ("N", "S", "E", "W"), to radians.
+    """
+    sign = -1 if direction in ("S", "W") else 1
+
+    return math.radians(sign * (degrees + minutes / 60 + seconds / 3600))
+
+
+def point_is_within_boundary(
+    point: np.ndarray,
+    boundary_points_input: List[np.ndarray],
+    ref_point: np.ndarray,
+    is_closed: bool = False
+) -> bool:
+    """
+    This function checks if a point (cartesian unit vector) is within a boundary, 
+    defined by a list of points. The boundary is open by default, but it can be set to close.
+    """
+    epsilon = 1e-9
+    i = 0
+    boundary_points = [b for b in boundary_points_input]
+    if is_closed and len(boundary_points_input) > 0:
+        boundary_points.append(boundary_points_input[0])
+    while i < len(boundary_points) - 1:
+        boundary_p1 = boundary_points[i]
+        boundary_p2 = boundary_points[i + 1]
+        normal_1 = np.cross(point, ref_point)
+        normal_2 = np.cross(boundary_p1, boundary_p2)
+        intersect_vector = np.cross(normal_1, normal_2)
+        intersect_1 = intersect_vector / np.linalg.norm(intersect_vector)
+        intersect_2 = -intersect_1
+
+        for intersect in [intersect_1, intersect_2]:
+            arcs_intersect = True
+            for arc in [[point, ref_point], [boundary_p1, boundary_p2]]:
+                theta_1_to_intersect = np.arccos(np.dot(
+                    arc[0], intersect) / (np.linalg.norm(arc[0]) * np.linalg.norm(intersect)))
+                theta_2_to_intersect = np.arccos(np.dot(
+                    arc[1], intersect) / (np.linalg.norm(arc[1]) * np.linalg.norm(intersect)))
+                theta_1_to_2 = np.arccos(
+                    np.dot(arc[0], arc[1]) / (np.linalg.norm(arc[0]) * np.linalg.norm(arc[1])))
+                arcs_intersect = arcs_intersect and (
+                    abs(theta_1_to_2 - theta_1_to_intersect - theta_2_to_intersect) <= epsilon)
+            if arcs_intersect:
+                return False
+        i += 1
+
+    return True
+
+
+def is_in_northern_airspace(lat: float, lon: float) -> bool:
+    """
+    This function finds if a latitude and longitude in radians 
+    are in the Northern Domestic Airspace.
+    """
+    # Find if point is above ceil or below floor
+    if lat > _NDA_CEIL_LAT:
+        return True
+    if lat < _NDA_FLOOR_LAT:
+        return False
+
+    # Find if point is within radius of arc segments of the NDA boundary
+    point = _unit_vector(lat=lat, lon=lon)
+    earth_radius = get_constant("earth_radius_ft") * get_constant("ft_to_nautical")
+    for arc in _NDA_BOUNDARY_ARCS:
+        distance = round(
+            earth_radius * np.arccos(np.clip(np.dot(point, arc["center"]), -1.0, 1.0)),
+            0
+        )
+        if distance <= arc["radius"]:
+            return False
+
+    # Find if point is north of the boundary
+    return point_is_within_boundary(
+        point=point,
+        boundary_points_input=_NDA_BOUNDARY_POINTS,
+        ref_point=_NDA_REF_POINT
+    )
+
+
+def _haversines(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    to_lat: float,
+    to_lon: float
+) -> np.ndarray:
+    """
+    This function returns the haversine of the central angles between an array of 
+    latitudes and longitudes in radians, and a given latitude and longitude.
+    """
+    # cos(to_lat) is the same for every point, so it's one scalar broadcast
+    cos_to_lat = math.cos(to_lat)
+
+    return np.sin((lats - to_lat) / 2) ** 2 + \
+        cos_to_lat * np.cos(lats) * np.sin((lons - to_lon) / 2) ** 2
+
+
+def waypoints_to_radians(waypoints: List[Row]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    This function converts the degrees, minutes, seconds and direction columns 
+    of a list of waypoint rows, into signed latitudes and longitudes in radians.
+
+    Parameters:
+    - waypoints (list): rows with the lat_degrees, lat_minutes, lat_seconds, 
+      lat_direction, lon_degrees, lon_minutes, lon_seconds and lon_direction columns.
+
+    Returns: 
+    - Tuple[np.ndarray, np.ndarray]: latitudes and longitudes in radians.
+    """
+    dms_to_radians = np.radians(np.array([1, 1 / 60, 1 / 3600]))
+
+    lats = np.array([
+        (waypoint.lat_degrees, waypoint.lat_minutes, waypoint.lat_seconds)
+        for waypoint in waypoints
+    ], dtype=float) @ dms_to_radians
+    lats[np.array([waypoint.lat_direction == "S" for waypoint in waypoints])] *= -1
+
+    lons = np.array([
+        (waypoint.lon_degrees, waypoint.lon_minutes, waypoint.lon_seconds)
+        for waypoint in waypoints
+    ], dtype=float) @ dms_to_radians
+    lons[np.array([waypoint.lon_direction == "W" for waypoint in waypoints])] *= -1
+
+    return lats, lons
+
+
+def great_arc_distances_within(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    to_lat: float,
+    to_lon: float,
+    distance: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    This function finds which points, from an array of latitudes and longitudes in radians, 
+    are within a distance in nautical miles of a given latitude and longitude.
+
+    Points are first filtered by comparing their haversine against the haversine 
+    of the distance, so the full distance is only computed for the points that pass.
+
+    Parameters:
+    - lats (np.ndarray): latitudes in radians.
+    - lons (np.ndarray): longitudes in radians.
+    - to_lat (float): latitude of the reference point in radians.
+    - to_lon (float): longitude of the reference point in radians.
+    - distance (float): maximum distance in nautical miles.
+
+    Returns: 
+    - Tuple[np.ndarray, np.ndarray]: indices of the points within the distance, 
+      and their distances rounded to the nearest nautical mile.
+    """
+    earth_radius = get_constant("earth_radius_ft") * get_constant("ft_to_nautical")
+    haversine = _haversines(lats=lats, lons=lons, to_lat=to_lat, to_lon=to_lon)
+
+    # Distances are rounded, so anything under distance + 0.5 NM can still be in range
+    max_angle = min((distance + 0.5) / earth_radius, math.pi)
+    candidates = np.flatnonzero(haversine <= math.sin(max_angle / 2) ** 2)
+
+    distances = np.round(
+        2 * earth_radius * np.arcsin(np.sqrt(np.clip(haversine[candidates], 0.0, 1.0))),
+        0
+    )
+    within = distances <= distance
+
+    return candidates[within], distances[within]
+
+
+def _degree_range_filter(
+    degrees_column,
+    direction_column,
+    directions: Tuple[str, str],
+    min_degrees: float,
+    max_degrees: float
+):
+    """
+    This function returns an sqlalchemy condition that keeps the coordinates 
+    that can be between min_degrees and max_degrees (signed decimal degrees), 
+    looking only at the whole degrees and direction columns.
+    """
+    positive_direction, negative_direction = directions
+    conditions = []
+    if max_degrees >= 0:
+        conditions.append(and_(
+            direction_column == positive_direction,
+            degrees_column.between(max(math.floor(min_degrees), 0), math.floor(max_degrees))
+        ))
+    if min_degrees < 0:
+        conditions.append(and_(
+            direction_column == negative_direction,
+            degrees_column.between(max(math.floor(-max_degrees), 0), math.floor(-min_degrees))
+        ))
+
+    return or_(*conditions)
+
+
+def waypoints_bounding_box_filter(lat: float, lon: float, distance: float):
+    """
+    This function returns an sqlalchemy condition that keeps the waypoints inside 
+    the lat/lon box that contains the circle of radius distance (in nautical miles), 
+    around a latitude and longitude in radians. It only uses the degrees and direction 
+    columns, so the database can use their index before any distance is calculated.
+    """
+    w = models.Waypoint
+    earth_radius = get_constant("earth_radius_ft") * get_constant("ft_to_nautical")
+
+    # Distances are rounded to the nearest nautical mile, so the box has half a mile of margin
+    angular_distance = (distance + 0.5) / earth_radius
+    lat_degrees = math.degrees(lat)
+    delta_lat_degrees = math.degrees(angular_distance)
+
+    lat_filter = _degree_range_filter(
+        degrees_column=w.lat_degrees,
+        direction_column=w.lat_direction,
+        directions=("N", "S"),
+        min_degrees=lat_degrees - delta_lat_degrees,
+        max_degrees=lat_degrees + delta_lat_degrees
+    )
+
+    # Every longitude is in range if the box contains a pole
+    if abs(lat_degrees) + delta_lat_degrees >= 90 or angular_distance >= math.pi / 2:
+        return lat_filter
+
+    lon_degrees = math.degrees(lon)
+    delta_lon_degrees = math.degrees(
+        math.asin(min(math.sin(angular_distance) / math.cos(lat), 1.0)))
+    min_lon_degrees = lon_degrees - delta_lon_degrees
+    max_lon_degrees = lon_degrees + delta_lon_degrees
+
+    # Split the box in two if it crosses the antimeridian
+    lon_ranges = [(min_lon_degrees, max_lon_degrees)]
+    if min_lon_degrees < -180:
+        lon_ranges = [(-180, max_lon_degrees), (min_lon_degrees + 360, 180)]
+    elif max_lon_degrees > 180:
+        lon_ranges = [(min_lon_degrees, 180), (-180, max_lon_degrees - 360)]
+
+    lon_filter = or_(*[_degree_range_filter(
+        degrees_column=w.lon_degrees,
+        direction_column=w.lon_direction,
+        directions=("E", "W"),
+        min_degrees=min_degrees,
+        max_degrees=max_degrees
+    ) for min_degrees, max_degrees in lon_ranges])
+
+    return and_(lat_filter, lon_filter)
+
+
 def find_nearby_aerodromes(
     aerodromes_query: List[Row[Tuple[models.Aerodrome, models.VfrWaypoint, models.Waypoint]]],
     lat: float,
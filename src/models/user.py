@@ -85,7 +85,7 @@ class User(BaseModel):
 
         permissions = ["admin", "master"] if self.is_admin and self.is_master else [
             "admin"] if self.is_admin else []
-        to_encode = {"email": self.email,
+        to_encode = {"id": self.id, "email": self.email,
                      "permissions": permissions, "active": self.is_active}
 
         encoded_jwt = jwt.encode(to_encode, jwt_key, algorithm=jwt_algorithm)
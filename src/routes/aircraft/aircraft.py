@@ -10,7 +10,6 @@ Usage:
 from typing import List, Dict, Any, Optional
 
 from fastapi import APIRouter, Depends, status, HTTPException
-from pydantic import ValidationError
 import pytz
 from sqlalchemy import and_, not_, or_
 from sqlalchemy.orm import Session
@@ -21,7 +20,6 @@ import schemas
 from utils import common_responses
 from utils.db import get_db
 from functions.data_processing import (
-    get_user_id_from_email,
     unload_aircraft,
     create_empty_tanks
 )
@@ -45,8 +43,7 @@ def get_aircraft_list(
     """
 
     # Get aircraft models
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     aircraft_models = db_session.query(models.Aircraft)\
         .filter(and_(
             models.Aircraft.owner_id == user_id,
@@ -62,34 +59,26 @@ def get_aircraft_list(
         models.PerformanceProfile.aircraft_id.in_(aircraft_ids)
     ).all()
 
-    # Organize aircraft list
-    try:
-        aircraft_list = [schemas.GetAircraftList(
-            id=aircraft.id,
-            make=aircraft.make,
-            model=aircraft.model,
-            abbreviation=aircraft.abbreviation,
-            registration=aircraft.registration,
-            created_at_utc=pytz.timezone(
-                'UTC').localize((aircraft.created_at)),
-            last_updated_utc=pytz.timezone(
-                'UTC').localize((aircraft.last_updated)),
-            profiles=[{
-                "id": profile.id,
-                "performance_profile_name": profile.name,
-                "is_complete": profile.is_complete,
-                "fuel_type_id": profile.fuel_type_id,
-                "is_preferred": profile.is_preferred,
-                "created_at_utc": pytz.timezone('UTC').localize((profile.created_at)),
-                "last_updated_utc": pytz.timezone('UTC').localize((profile.last_updated))
-            } for profile in performance_profiles if profile.aircraft_id == aircraft.id]
-        ) for aircraft in aircraft_models]
-    except ValidationError as error:
-        # pylint: disable=raise-missing-from
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error.errors()
-        )
+    # Organize aircraft list (database data, FastAPI validates the response)
+    utc = pytz.timezone('UTC')
+    aircraft_list = [schemas.GetAircraftList.model_construct(
+        id=aircraft.id,
+        make=aircraft.make,
+        model=aircraft.model,
+        abbreviation=aircraft.abbreviation,
+        registration=aircraft.registration,
+        created_at_utc=utc.localize((aircraft.created_at)),
+        last_updated_utc=utc.localize((aircraft.last_updated)),
+        profiles=[schemas.GetPerformanceProfileList.model_construct(
+            id=profile.id,
+            performance_profile_name=profile.name,
+            is_complete=profile.is_complete,
+            fuel_type_id=profile.fuel_type_id,
+            is_preferred=profile.is_preferred,
+            created_at_utc=utc.localize((profile.created_at)),
+            last_updated_utc=utc.localize((profile.last_updated))
+        ) for profile in performance_profiles if profile.aircraft_id == aircraft.id]
+    ) for aircraft in aircraft_models]
 
     # Filter Aircraft
     if complete_only:
@@ -115,8 +104,7 @@ def post_new_aircraft(
     Creates a new aircraft
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     # Check if aircraft already exists in database
     aircraft_exists = db_session.query(models.Aircraft).filter(and_(
@@ -164,8 +152,7 @@ def post_new_aircraft_performance_profile(
     """
 
     # Check if user has permission
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     aircraft = db_session.query(models.Aircraft).filter(and_(
         models.Aircraft.id == aircraft_id,
         models.Aircraft.owner_id == user_id
@@ -242,8 +229,7 @@ def post_new_aircraft_performance_profile_from_model(
     Creates a new aircraft performance profile from a model
     """
     # Check if user has permission
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     aircraft = db_session.query(models.Aircraft).filter(and_(
         models.Aircraft.id == aircraft_id,
         models.Aircraft.owner_id == user_id
@@ -430,8 +416,7 @@ def edit_aircraft(
     """
 
     # Check if aircraft exists
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     aircraft_query = db_session.query(models.Aircraft).filter(and_(
         models.Aircraft.id == aircraft_id,
         models.Aircraft.owner_id == user_id
@@ -493,8 +478,7 @@ def edit_aircraft_performance_profile(
         )
 
     # Check is user has permission to edit this profile
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     user_is_aircraft_owner = db_session.query(models.Aircraft).filter(and_(
         models.Aircraft.id == performance_profile_query.first().aircraft_id,
         models.Aircraft.owner_id == user_id
@@ -580,8 +564,7 @@ def make_aircraft_performance_profile_preferred_profile(
 
     # Check if user has permission to edit this profile
     aircraft_id = performance_profile_query.first().aircraft_id
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     user_is_aircraft_owner = db_session.query(models.Aircraft).filter(and_(
         models.Aircraft.id == aircraft_id,
         models.Aircraft.owner_id == user_id
@@ -647,8 +630,7 @@ def delete_aircraft_performance_profile(
     """
 
     # Check if performance profile exists and user has permission.
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     profile = db_session.query(models.PerformanceProfile).filter(and_(
         models.PerformanceProfile.id == profile_id,
         models.PerformanceProfile.aircraft_id.isnot(None)
@@ -712,8 +694,7 @@ def delete_aircraft(
     """
 
     # Check if aircraft exists and user has permission.
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     aircraft_query = db_session.query(models.Aircraft).filter(and_(
         models.Aircraft.id == aircraft_id,
         models.Aircraft.owner_id == user_id
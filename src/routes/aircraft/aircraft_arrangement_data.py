@@ -19,7 +19,6 @@ from utils import common_responses
 from utils.db import get_db
 from functions.data_processing import (
     check_performance_profile_and_permissions,
-    get_user_id_from_email,
     check_completeness_and_make_preferred_if_complete
 )
 
@@ -43,9 +42,7 @@ def get_aircraft_arrangement_data(
     # Get the performance profile and check permissions.
     check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -110,9 +107,7 @@ def post_new_baggage_compartment(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -160,9 +155,7 @@ def post_new_seat_row(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -219,9 +212,7 @@ def post_new_fuel_tank(
     # Check performance profile and permissions.
     profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     ).first()
@@ -320,9 +311,7 @@ def edit_baggage_compartment(
     # Check performance profile and permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=compartment_query.first().performance_profile_id
     ).first()
@@ -376,9 +365,7 @@ def edit_seat_row(
     # Check performance profile and permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=row_query.first().performance_profile_id
     ).first()
@@ -433,9 +420,7 @@ def edit_fuel_tank(
     # Check performance profile and permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=tank_query.first().performance_profile_id
     ).first()
@@ -500,9 +485,7 @@ def delete_baggage_compartment(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=compartment_query.first().performance_profile_id
     ).first()
@@ -536,9 +519,7 @@ def delete_seat_row(
     performance_profile_id = row_query.first().performance_profile_id
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=performance_profile_id
     ).first()
@@ -578,9 +559,7 @@ def delete_fuel_tank(
     performance_profile_id = tank_query.first().performance_profile_id
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=performance_profile_id
     ).first()
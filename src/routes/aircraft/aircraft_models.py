@@ -11,7 +11,6 @@ Usage:
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, status, HTTPException
-from pydantic import ValidationError
 import pytz
 from sqlalchemy import and_, or_, not_
 from sqlalchemy.orm import Session
@@ -53,23 +52,16 @@ def get_performance_profile_model_list(
         )
     )).all()
 
-    # Organize performance profile list
-    try:
-        profiles = [schemas.GetPerformanceProfileList(
-            id=profile.id,
-            performance_profile_name=profile.name,
-            is_complete=profile.is_complete,
-            fuel_type_id=profile.fuel_type_id,
-            created_at_utc=pytz.timezone('UTC').localize((profile.created_at)),
-            last_updated_utc=pytz.timezone(
-                'UTC').localize((profile.last_updated))
-        ) for profile in performance_profiles]
-    except ValidationError as error:
-        # pylint: disable=raise-missing-from
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error.errors()
-        )
+    # Organize performance profile list (database data, FastAPI validates the response)
+    utc = pytz.timezone('UTC')
+    profiles = [schemas.GetPerformanceProfileList.model_construct(
+        id=profile.id,
+        performance_profile_name=profile.name,
+        is_complete=profile.is_complete,
+        fuel_type_id=profile.fuel_type_id,
+        created_at_utc=utc.localize((profile.created_at)),
+        last_updated_utc=utc.localize((profile.last_updated))
+    ) for profile in performance_profiles]
 
     return profiles
 
@@ -21,7 +21,6 @@ from utils import common_responses, csv_tools as csv
 from utils.config import get_table_header
 from utils.db import get_db
 from functions.data_processing import (
-    get_user_id_from_email,
     check_performance_profile_and_permissions,
     check_completeness_and_make_preferred_if_complete
 )
@@ -43,9 +42,7 @@ def get_takeoff_landing_performance_csv_file(
     # Check permissions
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -115,9 +112,7 @@ def get_climb_performance_csv_file(
     # Check permissions
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -184,9 +179,7 @@ def get_cruise_performance_csv_file(
     # Check permissions
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -257,9 +250,7 @@ def get_takeoff_landing_performance_data(
     # Get the performance profile and check permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -339,9 +330,7 @@ def get_climb_performance_data(
     # Get the performance profile and check permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -406,9 +395,7 @@ def get_cruise_performance_data(
     # Get the performance profile and check permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -483,9 +470,7 @@ async def manage_takeoff_landing_performance_data_with_csv_file(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -498,13 +483,13 @@ async def manage_takeoff_landing_performance_data_with_csv_file(
     headers = get_table_header(table_name)
 
     try:
-        data_list = [schemas.TakeoffLandingPerformanceDataEntry(
-            weight_lb=float(row[headers["weight_lb"]]),
-            temperature_c=float(row[headers["temperature_c"]]),
-            pressure_alt_ft=float(row[headers["pressure_alt_ft"]]),
-            groundroll_ft=float(row[headers["groundroll_ft"]]),
-            obstacle_clearance_ft=float(row[headers["obstacle_clearance_ft"]])
-        ) for row in await csv.extract_data(file=csv_file)]
+        data_list = schemas.TAKEOFF_LANDING_PERFORMANCE_DATA_LIST.validate_python([{
+            "weight_lb": float(row[headers["weight_lb"]]),
+            "temperature_c": float(row[headers["temperature_c"]]),
+            "pressure_alt_ft": float(row[headers["pressure_alt_ft"]]),
+            "groundroll_ft": float(row[headers["groundroll_ft"]]),
+            "obstacle_clearance_ft": float(row[headers["obstacle_clearance_ft"]])
+        } for row in await csv.extract_data(file=csv_file)])
 
     except KeyError as error:
         # pylint: disable=raise-missing-from
@@ -603,9 +588,7 @@ async def manage_climb_performance_data_with_csv_file(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -617,22 +600,22 @@ async def manage_climb_performance_data_with_csv_file(
     headers = get_table_header(table_name)
 
     try:
-        data_list = [schemas.ClimbPerformanceDataEntry(
-            weight_lb=int(float(row[headers["weight_lb"]])),
-            temperature_c=int(float(row[headers["temperature_c"]])),
-            pressure_alt_ft=int(float(row[headers["pressure_alt_ft"]])),
-            time_min=int(float(row[headers["time_min"]])),
-            fuel_gal=row[headers["fuel_gal"]],
-            distance_nm=int(float(row[headers["distance_nm"]])),
-            kias=None if headers["kias"] not in row
+        data_list = schemas.CLIMB_PERFORMANCE_DATA_LIST.validate_python([{
+            "weight_lb": int(float(row[headers["weight_lb"]])),
+            "temperature_c": int(float(row[headers["temperature_c"]])),
+            "pressure_alt_ft": int(float(row[headers["pressure_alt_ft"]])),
+            "time_min": int(float(row[headers["time_min"]])),
+            "fuel_gal": row[headers["fuel_gal"]],
+            "distance_nm": int(float(row[headers["distance_nm"]])),
+            "kias": None if headers["kias"] not in row
             or not row[headers["kias"]]
             or row[headers["kias"]].isspace()
             else int(float(row[headers["kias"]])),
-            fpm=None if headers["fpm"] not in row
+            "fpm": None if headers["fpm"] not in row
             or not row[headers["fpm"]]
             or row[headers["fpm"]].isspace()
             else int(float(row[headers["fpm"]]))
-        ) for row in await csv.extract_data(file=csv_file)]
+        } for row in await csv.extract_data(file=csv_file)])
 
     except KeyError as error:
         # pylint: disable=raise-missing-from
@@ -711,9 +694,7 @@ async def manage_cruise_performance_data_with_csv_file(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -725,15 +706,15 @@ async def manage_cruise_performance_data_with_csv_file(
     headers = get_table_header(table_name)
 
     try:
-        data_list = [schemas.CruisePerformanceDataEntry(
-            weight_lb=int(float(row[headers["weight_lb"]])),
-            temperature_c=int(float(row[headers["temperature_c"]])),
-            pressure_alt_ft=int(float(row[headers["pressure_alt_ft"]])),
-            rpm=int(float(row[headers["rpm"]])),
-            bhp_percent=int(float(row[headers["bhp_percent"]])),
-            ktas=int(float(row[headers["ktas"]])),
-            gph=row[headers["gph"]]
-        ) for row in await csv.extract_data(file=csv_file)]
+        data_list = schemas.CRUISE_PERFORMANCE_DATA_LIST.validate_python([{
+            "weight_lb": int(float(row[headers["weight_lb"]])),
+            "temperature_c": int(float(row[headers["temperature_c"]])),
+            "pressure_alt_ft": int(float(row[headers["pressure_alt_ft"]])),
+            "rpm": int(float(row[headers["rpm"]])),
+            "bhp_percent": int(float(row[headers["bhp_percent"]])),
+            "ktas": int(float(row[headers["ktas"]])),
+            "gph": row[headers["gph"]]
+        } for row in await csv.extract_data(file=csv_file)])
 
     except KeyError as error:
         # pylint: disable=raise-missing-from
@@ -794,9 +775,7 @@ def edit_takeoff_landing_adjustment_values(
     # Check performance profile and permissions.
     performance_profile_query = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -873,9 +852,7 @@ def edit_climb_performance_adjustment_values(
     # Check performance profile and permissions.
     performance_profile_query = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
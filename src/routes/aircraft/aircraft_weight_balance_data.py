@@ -24,7 +24,6 @@ from utils import common_responses
 from utils.db import get_db
 from functions.data_processing import (
     check_performance_profile_and_permissions,
-    get_user_id_from_email,
     check_completeness_and_make_preferred_if_complete
 )
 
@@ -48,9 +47,7 @@ def get_aircraft_weight_balance_data(
     # Get the performance profile and check permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -120,9 +117,7 @@ async def get_aircraft_weight_and_balance_graph(
     # Get the performance profile and check permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id,
         auth_non_admin_get_model=True
@@ -250,9 +245,7 @@ def post_new_weight_and_balance_profile(
     # Check performance profile and permissions.
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -339,9 +332,7 @@ def edit_weight_and_balance_data_for_performance_profile(
     # Check performance profile and permissions.
     performance_profile_query = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=profile_id
     )
@@ -409,9 +400,7 @@ def edit_weight_and_balance_profile(
     # Check performance profile and permissions.
     performance_profile = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=wb_profile_query.first().performance_profile_id
     ).first()
@@ -487,9 +476,7 @@ def delete_weight_and_balance_profile(
     performance_profile_id = wb_profile_query.first().performance_profile_id
     _ = check_performance_profile_and_permissions(
         db_session=db_session,
-        user_id=get_user_id_from_email(
-            email=current_user.email, db_session=db_session
-        ),
+        user_id=current_user.user_id,
         user_is_active_admin=current_user.is_active and current_user.is_admin,
         profile_id=performance_profile_id
     ).first()
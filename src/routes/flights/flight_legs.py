@@ -18,7 +18,6 @@ import schemas
 from utils import common_responses
 from utils.db import get_db
 from functions.data_processing import (
-    get_user_id_from_email,
     get_extensive_flight_data_for_return
 )
 from functions import navigation
@@ -42,8 +41,7 @@ def post_new_leg(
     """
 
     # Check flight exists
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.id == flight_id,
         models.Flight.pilot_id == user_id
@@ -227,8 +225,7 @@ def edit_flight_leg(
     flight_id = leg_query.first().flight_id
 
     # Check user has permission to update flight
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.id == flight_id,
         models.Flight.pilot_id == user_id
@@ -370,8 +367,7 @@ def update_flight_waypoints(
     Refreshes all the flight waypoints with the most up-to-date VFR and User waypoints' data
     """
     # Check flight exists and user has permission to update flight
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.id == flight_id,
         models.Flight.pilot_id == user_id
@@ -508,8 +504,7 @@ def delete_flight_leg(
     """
 
     # Check leg exists and user has permission to delete
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     leg_query_results = db_session.query(models.Leg, models.Flight)\
         .join(models.Flight, models.Leg.flight_id == models.Flight.id)\
         .filter(and_(models.Leg.id == leg_id, models.Flight.pilot_id == user_id)).first()
@@ -11,7 +11,7 @@ from typing import List, Dict
 import io
 
 from fastapi import APIRouter, Depends, status, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 import matplotlib.pyplot as plt
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
@@ -24,7 +24,6 @@ from utils.config import get_table_header
 from utils.db import get_db
 from functions import navigation
 from functions.aircraft_performance import get_landing_takeoff_data
-from functions.data_processing import get_user_id_from_email
 
 router = APIRouter(tags=["Flight Plan"])
 
@@ -248,29 +247,31 @@ def get_weight_balance_calculations(
         models.SeatRow.performance_profile_id == performance_profile[0].id
     ).order_by(models.SeatRow.arm_in).all()
 
-    seats = []
-    for seat_row in seat_rows:
-        persons = db_session.query(
-            models.PersonOnBoard,
-            models.User.weight_lb,
-            models.PassengerProfile.weight_lb
-        ).outerjoin(
-            models.User,
-            models.PersonOnBoard.user_id == models.User.id
-        ).outerjoin(
-            models.PassengerProfile,
-            models.PersonOnBoard.passenger_profile_id == models.PassengerProfile.id
-        ).filter(and_(
-            models.PersonOnBoard.seat_row_id == seat_row.id,
-            models.PersonOnBoard.flight_id == flight_id
-        )).all()
-
-        total_weight = round(float(sum((
+    # Get the weight of all persons on board in one query, grouped by seat row
+    person_weights = {seat_row.id: [] for seat_row in seat_rows}
+    for pob, user_weight, passenger_weight in db_session.query(
+        models.PersonOnBoard,
+        models.User.weight_lb,
+        models.PassengerProfile.weight_lb
+    ).outerjoin(
+        models.User,
+        models.PersonOnBoard.user_id == models.User.id
+    ).outerjoin(
+        models.PassengerProfile,
+        models.PersonOnBoard.passenger_profile_id == models.PassengerProfile.id
+    ).filter(and_(
+        models.PersonOnBoard.seat_row_id.in_(list(person_weights)),
+        models.PersonOnBoard.flight_id == flight_id
+    )).all():
+        person_weights[pob.seat_row_id].append(
             pob.weight_lb if pob.weight_lb is not None
             else user_weight if user_weight is not None
             else passenger_weight
-            for pob, user_weight, passenger_weight in persons
-        ))), 2)
+        )
+
+    seats = []
+    for seat_row in seat_rows:
+        total_weight = round(float(sum(person_weights[seat_row.id])), 2)
 
         seats.append({
             "weight_lb": total_weight,
@@ -290,15 +291,18 @@ def get_weight_balance_calculations(
         models.BaggageCompartment.performance_profile_id == performance_profile[0].id
     ).order_by(models.BaggageCompartment.arm_in).all()
 
+    # Get the weight of all baggages in one query, grouped by compartment
+    baggage_weights = {compartment.id: [] for compartment in baggage_compartments}
+    for baggage in db_session.query(models.Baggage).filter(and_(
+        models.Baggage.baggage_compartment_id.in_(list(baggage_weights)),
+        models.Baggage.flight_id == flight_id
+    )).all():
+        baggage_weights[baggage.baggage_compartment_id].append(baggage.weight_lb)
+
     compartments = []
     for baggage_compartment in baggage_compartments:
-        baggages = db_session.query(models.Baggage).filter(and_(
-            models.Baggage.baggage_compartment_id == baggage_compartment.id,
-            models.Baggage.flight_id == flight_id
-        )).all()
-
         total_weight = round(
-            float(sum((baggage.weight_lb for baggage in baggages))), 2)
+            float(sum(baggage_weights[baggage_compartment.id])), 2)
 
         compartments.append({
             "weight_lb": total_weight,
@@ -330,12 +334,15 @@ def get_weight_balance_calculations(
         models.FuelTank.performance_profile_id == performance_profile[0].id
     ).order_by(models.FuelTank.burn_sequence).all()
 
+    # Get the fuel of all tanks in one query
+    fuel_by_tank = {fuel.fuel_tank_id: fuel for fuel in db_session.query(models.Fuel).filter(and_(
+        models.Fuel.fuel_tank_id.in_([fuel_tank.id for fuel_tank in fuel_tanks]),
+        models.Fuel.flight_id == flight_id
+    )).all()}
+
     fuel_on_board = []
     for fuel_tank in fuel_tanks:
-        fuel = db_session.query(models.Fuel).filter(and_(
-            models.Fuel.fuel_tank_id == fuel_tank.id,
-            models.Fuel.flight_id == flight_id
-        )).first()
+        fuel = fuel_by_tank.get(fuel_tank.id)
 
         total_weight = round(fuel_density * float(fuel.gallons), 2)
 
@@ -613,15 +620,19 @@ def navigation_log(
     Returns the Navigation Log data of the requested flight
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     nav_log_data, _ = get_nav_log_and_fuel_calculations(
         flight_id=flight_id,
         db_session=db_session,
         user_id=user_id
     )
 
-    return nav_log_data
+    # Validate and serialize in pydantic-core, instead of FastAPI's jsonable_encoder
+    nav_log = schemas.NAVIGATION_LOG_RESULTS_LIST.validate_python(nav_log_data)
+    return Response(
+        content=schemas.NAVIGATION_LOG_RESULTS_LIST.dump_json(nav_log),
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -637,8 +648,7 @@ def download_navigation_log_csv_file(
     Returns the Navigation Log data of the requested flight, in a CSV File
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     nav_log_data, _ = get_nav_log_and_fuel_calculations(
         flight_id=flight_id,
         db_session=db_session,
@@ -717,8 +727,7 @@ def fuel_calculations(
     Returns the fuel calculations of the requested flight
     """
     # Get fuel data
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     _, fuel_data = get_nav_log_and_fuel_calculations(
         flight_id=flight_id,
         db_session=db_session,
@@ -768,8 +777,7 @@ def takeoff_and_landing_distances(
     """
 
     # Get flight and check permissions
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.id == flight_id,
         models.Flight.pilot_id == user_id
@@ -948,14 +956,20 @@ def weight_and_balance_report(
     """
     Returns the weight and balance data of the requested flight
     """
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-    return get_weight_balance_calculations(
+    user_id = current_user.user_id
+    weight_balance_data = get_weight_balance_calculations(
         flight_id=flight_id,
         db_session=db_session,
         user_id=user_id
     )
 
+    # Validate and serialize in pydantic-core, instead of FastAPI's jsonable_encoder
+    return Response(
+        content=schemas.WeightAndBalanceReport.model_validate(
+            weight_balance_data).model_dump_json(),
+        media_type="application/json"
+    )
+
 
 @router.get(
     "/weight-balance-graph/{flight_id}",
@@ -979,8 +993,7 @@ async def weight_and_balance_graph(
     labels_offset = ((-0.2, 1), (0.2, 1), (-0.2, 1))
 
     # Get weight and balance data
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     weight_balance_data = get_weight_balance_calculations(
         flight_id=flight_id,
         db_session=db_session,
@@ -19,7 +19,6 @@ import models
 import schemas
 from utils import common_responses
 from utils.db import get_db
-from functions.data_processing import get_user_id_from_email
 
 router = APIRouter(tags=["Flight Weight and Balance Data"])
 
@@ -39,8 +38,7 @@ def get_all_persons_on_board(
     """
 
     # Check flight exist
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         models.Flight.id == flight_id
@@ -112,8 +110,7 @@ def get_all_flight_baggage(
     """
 
     # Check flight exist
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         models.Flight.id == flight_id
@@ -157,8 +154,7 @@ def get_all_flight_fuel(
     """
 
     # Check flight exist
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         models.Flight.id == flight_id
@@ -224,8 +220,7 @@ def add_person_on_board(
     """
 
     # Check flight exist
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -388,8 +383,7 @@ def add_flight_baggage(
     """
 
     # Check flight exist
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -477,8 +471,7 @@ def edit_person_on_board(
 
     # Check flight exist
     flight_id = person_on_board_query.first().flight_id
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -655,8 +648,7 @@ def edit_flight_baggage(
 
     # Check flight exist
     flight_id = baggage_query.first().flight_id
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -742,8 +734,7 @@ def edit_flight_fuel(
 
     # Check flight exist
     flight_id = fuel_query.first().flight_id
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -821,8 +812,7 @@ def delete_person_on_board(
 
     # Check flight exist
     flight_id = person_on_board_query.first().flight_id
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -877,8 +867,7 @@ def delete_flight_baggage(
 
     # Check flight exist
     flight_id = baggage_query.first().flight_id
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(
         models.Flight,
         models.Aircraft,
@@ -22,7 +22,6 @@ import schemas
 from utils import common_responses
 from utils.db import get_db
 from functions.data_processing import (
-    get_user_id_from_email,
     get_extensive_flight_data_for_return,
     get_basic_flight_data_for_return
 )
@@ -44,8 +43,7 @@ def get_all_flight(
     """
     Returns the list of flights of the authenticated user
     """
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     user_flights = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         or_(
@@ -74,8 +72,7 @@ def get_flight(
     """
     Returns the detailed data of the requested flight
     """
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight_list = get_extensive_flight_data_for_return(
         flight_ids=[flight_id],
         db_session=db_session,
@@ -105,8 +102,7 @@ def post_new_flight(
     Creates a new flight
     """
     # Get user ID
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     # Check aircraft exists and is owned by user
     aircraft = db_session.query(models.PerformanceProfile, models.Aircraft).join(
@@ -273,8 +269,7 @@ def edit_flight(
     """
 
     # Create flight query and check if flight exists
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight_query = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         models.Flight.id == flight_id
@@ -312,8 +307,7 @@ def change_aircraft(
     Changes a flight's aircraft
     """
     # Get user ID
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     # Check if flight exists
     flight_query = db_session.query(models.Flight).filter(and_(
@@ -392,8 +386,7 @@ def edit_departure_arrival(
     """
 
     # Check if flight exists
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         models.Flight.id == flight_id
@@ -456,8 +449,7 @@ def delete_flight(
     """
 
     # Create flight query and check if flight exists
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     flight_query = db_session.query(models.Flight).filter(and_(
         models.Flight.pilot_id == user_id,
         models.Flight.id == flight_id
@@ -21,7 +21,6 @@ import models
 import schemas
 from utils import common_responses
 from utils.db import get_db
-from functions.data_processing import get_user_id_from_email
 
 
 router = APIRouter(tags=["Users"])
@@ -95,8 +94,7 @@ def get_passenger_profiles(
     Returns the list of passenger profiles from the authenticated user
     (if a profile ID is provided, only returns one passenger profile)
     """
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     profiles = db_session.query(models.PassengerProfile).filter(and_(
         models.PassengerProfile.creator_id == user_id,
         or_(
@@ -191,8 +189,7 @@ def add_new_passenger_profile(
     Creates a new passenger profile for the authenticated user
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     passenger_already_exists = db_session.query(models.PassengerProfile).filter(and_(
         models.PassengerProfile.name == passenger_profile_data.name,
@@ -385,8 +382,7 @@ def edit_existing_passenger_profile(
     Edits a Passenger Profile
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     passenger_already_exists = db_session.query(models.PassengerProfile).filter(and_(
         models.PassengerProfile.name == passenger_profile_data.name,
@@ -469,8 +465,7 @@ def delete_passenger_profile(
     Deletes a passenger profile
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     deleted = db_session.query(models.PassengerProfile).filter(and_(
         models.PassengerProfile.id == profile_id,
         models.PassengerProfile.creator_id == user_id
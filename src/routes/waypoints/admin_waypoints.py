@@ -12,7 +12,8 @@ import re
 
 from fastapi import APIRouter, Depends, status, HTTPException
 import pytz
-from sqlalchemy import and_, not_
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 import auth
@@ -20,7 +21,10 @@ import models
 import schemas
 from utils import common_responses
 from utils.db import get_db
-from functions.data_processing import get_user_id_from_email, clean_string
+from functions.data_processing import (
+    clean_string,
+    clear_aerodrome_status_cache
+)
 from functions.navigation import get_magnetic_variation_for_waypoint
 
 
@@ -107,21 +111,6 @@ def update_vfr_waypoint(
             detail="The waypoint you're trying to update is not in the database."
         )
 
-    duplicated_code = db_session.query(models.VfrWaypoint).filter(and_(
-        models.VfrWaypoint.code == waypoint.code,
-        not_(models.VfrWaypoint.waypoint_id == waypoint_id)
-    )).first()
-
-    if duplicated_code:
-        is_aerodrome = db_session.query(models.Aerodrome).filter_by(
-            vfr_waypoint_id=vfr_waypoint_exists.waypoint_id).first()
-
-        msg = f"{'Aerodrome' if is_aerodrome else 'Waypoint'} '{waypoint.code}' already exists."
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=msg
-        )
-
     new_waypoint = models.Waypoint(
         lat_degrees=waypoint.lat_degrees,
         lat_minutes=waypoint.lat_minutes,
@@ -151,13 +140,34 @@ def update_vfr_waypoint(
     db_session.query(models.Waypoint).filter(
         models.Waypoint.id == waypoint_id).update(update_waypoint_data)
 
-    db_session.query(models.VfrWaypoint).filter(
-        models.VfrWaypoint.waypoint_id == waypoint_id).update({
-            "code": waypoint.code,
-            "name": waypoint.name,
-            "creator_id": creator_id,
-            "hidden": waypoint.hidden
-        })
+    # The unique constraint on vfr_waypoints.code rejects duplicated codes
+    try:
+        db_session.query(models.VfrWaypoint).filter(
+            models.VfrWaypoint.waypoint_id == waypoint_id).update({
+                "code": waypoint.code,
+                "name": waypoint.name,
+                "creator_id": creator_id,
+                "hidden": waypoint.hidden
+            })
+    except IntegrityError:
+        db_session.rollback()
+        duplicated_code = db_session.query(models.VfrWaypoint).filter(and_(
+            models.VfrWaypoint.code == waypoint.code,
+            models.VfrWaypoint.waypoint_id != waypoint_id
+        )).first()
+
+        if not duplicated_code:
+            raise
+
+        is_aerodrome = db_session.query(models.Aerodrome).filter_by(
+            vfr_waypoint_id=duplicated_code.waypoint_id).first()
+
+        msg = f"{'Aerodrome' if is_aerodrome else 'Waypoint'} '{waypoint.code}' already exists."
+        # pylint: disable=raise-missing-from
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=msg
+        )
 
     return db_session
 
@@ -176,8 +186,7 @@ def post_new_vfr_waypoint(
     Creates a new VFR Waypoint (only admin users can use this endpoint)
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     result = post_vfr_waypoint(
         waypoint=waypoint, db_session=db_session, creator_id=user_id)
 
@@ -210,8 +219,7 @@ def post_registered_aerodrome(
             detail="Please provide a valid status ID."
         )
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     waypoint_result = post_vfr_waypoint(
         waypoint=aerodrome,
@@ -282,9 +290,10 @@ def post_aerodrome_status(
     new_aerodrome_status = models.AerodromeStatus(status=clean_status)
     db_session.add(new_aerodrome_status)
     db_session.commit()
+    clear_aerodrome_status_cache()
     db_session.refresh(new_aerodrome_status)
 
-    return new_aerodrome_status
+    return {"id": new_aerodrome_status.id, "status": new_aerodrome_status.status}
 
 
 @router.put(
@@ -302,8 +311,7 @@ def edit_vfr_waypoint(
     Editss a VFR Waypoint (only admin users can use this endpoint)
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     is_aerodrome = db_session.query(models.Aerodrome).filter(
         models.Aerodrome.vfr_waypoint_id == waypoint_id).first()
     if is_aerodrome:
@@ -364,8 +372,7 @@ def edit_registered_aerodrome(
             detail="Please provide a valid status ID."
         )
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
     waypoint_data = schemas.VfrWaypointData(
         code=aerodrome.code,
         name=aerodrome.name,
@@ -472,3 +479,4 @@ def delete_aerodrome_status(
     if not deleted:
         raise common_responses.internal_server_error()
     db_session.commit()
+    clear_aerodrome_status_cache()
@@ -20,7 +20,6 @@ import schemas
 from utils import csv_tools as csv
 from utils.config import get_table_header
 from utils.db import get_db
-from functions.data_processing import get_user_id_from_email
 from functions.navigation import get_magnetic_variation_for_waypoint
 
 router = APIRouter(tags=["Manage Waypoints"])
@@ -243,8 +242,7 @@ async def manage_vfr_waypoints_with_csv_file(
         lambda i: i.code in list(db_vfr_waypoint_ids.keys()), data_list)]
 
     # Add data
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     for waypoint in data_to_add:
         new_waypoint = models.Waypoint(
@@ -424,8 +422,7 @@ async def manage_registered_aerodrome_with_csv_file(
         lambda i: i.code in list(db_vfr_waypoint_ids.keys()), data_list)]
 
     # Add data
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
     for aerodrome in data_to_add:
         new_waypoint = models.Waypoint(
@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, status, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 import pytz
-from sqlalchemy import and_, or_, not_
+from sqlalchemy import and_, or_, not_, exists, func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 import auth
@@ -22,10 +22,15 @@ import schemas
 from utils import common_responses, csv_tools as csv
 from utils.config import get_table_header
 from utils.db import get_db
-from functions.data_processing import get_user_id_from_email, runways_are_unique
+from functions.data_processing import runways_are_unique
 
 router = APIRouter(tags=["Runways"])
 
+UTC = pytz.timezone('UTC')
+RUNWAY_HEADERS = get_table_header("runways")
+AERODROME_HEADERS = get_table_header("aerodrome_codes")
+SURFACE_HEADERS = get_table_header("runway_surface_ids")
+
 
 @router.get("", status_code=status.HTTP_200_OK, response_model=List[schemas.RunwayReturn])
 def get_all_runways(
@@ -42,39 +47,32 @@ def get_all_runways(
     r = models.Runway
     s = models.RunwaySurface
 
-    aerodromes = db_session.query(a.id, v.code)\
-        .filter(a.vfr_waypoint is not None)\
-        .join(v, a.vfr_waypoint_id == v.waypoint_id).all()
-    aerodrome_ids = [a[0] for a in aerodromes]
-    aerodrome_codes = {a[0]: a[1] for a in aerodromes}
-
-    runways = db_session.query(r, s.surface)\
-        .filter(and_(
-            models.Runway.aerodrome_id.in_(aerodrome_ids),
-            or_(
-                not_(runway_id),
-                models.Runway.id == runway_id
-            )
-        ))\
-        .join(s, r.surface_id == s.id).all()
-
-    runways_return = [schemas.RunwayReturn(
-        id=r[0].id,
-        length_ft=r[0].length_ft,
-        landing_length_ft=r[0].landing_length_ft,
-        intersection_departure_length_ft=r[0].intersection_departure_length_ft,
-        number=r[0].number,
-        position=r[0].position,
-        surface_id=r[0].surface_id,
-        aerodrome_id=r[0].aerodrome_id,
-        surface=r[1],
-        aerodrome=aerodrome_codes[r[0].aerodrome_id],
-        created_at_utc=pytz.timezone('UTC').localize((r[0].created_at)),
-        last_updated_utc=pytz.timezone('UTC').localize((r[0].last_updated))
-    ) for r in runways]
-
-    runways_return.sort(key=lambda r: (
-        r.aerodrome, r.number, r.position))
+    # lambda_stmt caches the compiled SQL, so it is not rebuilt on every request
+    runways_stmt = lambda_stmt(lambda: select(r, s.surface, v.code)
+                               .join(s, r.surface_id == s.id)
+                               .join(a, r.aerodrome_id == a.id)
+                               .join(v, a.vfr_waypoint_id == v.waypoint_id)
+                               .order_by(v.code, r.number, r.position))
+    if runway_id:
+        runways_stmt += lambda stmt: stmt.where(r.id == runway_id)
+
+    runways = db_session.execute(runways_stmt).all()
+
+    # Database data, FastAPI validates the response
+    runways_return = [schemas.RunwayReturn.model_construct(
+        id=runway.id,
+        length_ft=runway.length_ft,
+        landing_length_ft=runway.landing_length_ft,
+        intersection_departure_length_ft=runway.intersection_departure_length_ft,
+        number=runway.number,
+        position=runway.position,
+        surface_id=runway.surface_id,
+        aerodrome_id=runway.aerodrome_id,
+        surface=surface,
+        aerodrome=code,
+        created_at_utc=UTC.localize((runway.created_at)),
+        last_updated_utc=UTC.localize((runway.last_updated))
+    ) for runway, surface, code in runways]
 
     return runways_return
 
@@ -99,16 +97,15 @@ def get_csv_file_with_all_runways(
         .filter(a.user_waypoint_id.is_(None))
         .join(v, a.vfr_waypoint_id == v.waypoint_id).all()]
 
-    aerodrome_ids = [item["id"] for item in aerodromes]
     aerodrome_codes = {a["id"]: a["code"] for a in aerodromes}
 
     runways = db_session.query(models.Runway)\
-        .filter(models.Runway.aerodrome_id.in_(aerodrome_ids)).all()
+        .filter(models.Runway.aerodrome_id.in_(list(aerodrome_codes))).all()
     surfaces = db_session.query(models.RunwaySurface).all()
 
-    runway_headers = get_table_header("runways")
-    aerodrome_headers = get_table_header("aerodrome_codes")
-    surface_headers = get_table_header("runway_surface_ids")
+    runway_headers = RUNWAY_HEADERS
+    aerodrome_headers = AERODROME_HEADERS
+    surface_headers = SURFACE_HEADERS
 
     files_data = [
         {
@@ -166,9 +163,8 @@ def get_csv_file_with_all_runways(
         }
     ]
 
-    zip_buffer = csv.zip_csv_files_from_data_list(files_data)
     response = StreamingResponse(
-        iter([zip_buffer.getvalue()]),
+        csv.zip_csv_files_from_data_list(files_data),
         media_type="application/zip",
         headers={
             "Content-Disposition": 'attachment; filename="runways_data.zip"',
@@ -193,10 +189,12 @@ def get_all_runway_surfaces(
     Returns all runway surfaces
     """
 
-    return db_session.query(models.RunwaySurface).filter(or_(
-        not_(runway_id),
-        models.RunwaySurface.id == runway_id
-    )).order_by(models.RunwaySurface.surface).all()
+    surfaces_query = db_session.query(models.RunwaySurface)
+    if runway_id:
+        surfaces_query = surfaces_query.filter(
+            models.RunwaySurface.id == runway_id)
+
+    return surfaces_query.order_by(models.RunwaySurface.surface).all()
 
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=schemas.RunwayReturn)
@@ -209,41 +207,53 @@ def post_runway(
     Creates a new runway for a given aerodrome
     """
 
-    # Check if aerodrome exists
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-    aerodrome = db_session.query(models.Aerodrome).filter_by(
-        id=runway_data.aerodrome_id).first()
+    # Get the aerodrome, surface and existing runway data in one query
+    user_id = current_user.user_id
+    aerodrome_row = db_session.query(
+        models.Aerodrome.vfr_waypoint_id,
+        models.UserWaypoint.creator_id,
+        exists().where(models.RunwaySurface.id == runway_data.surface_id),
+        exists().where(and_(
+            models.Runway.aerodrome_id == runway_data.aerodrome_id,
+            models.Runway.number == runway_data.number,
+            or_(
+                models.Runway.position.is_(None),
+                runway_data.position is None,
+                models.Runway.position == runway_data.position
+            )
+        ))
+    ).select_from(models.Aerodrome)\
+        .outerjoin(models.UserWaypoint, and_(
+            models.UserWaypoint.waypoint_id == models.Aerodrome.id,
+            models.UserWaypoint.creator_id == user_id
+        ))\
+        .filter(models.Aerodrome.id == runway_data.aerodrome_id).first()
 
-    if not aerodrome:
+    # Check if aerodrome exists
+    if aerodrome_row is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Please provide a valid Aerodrome ID."
         )
 
     # Check if user has permission to update this aerodrome
+    aerodrome_vfr_waypoint_id, aerodrome_creator_id, surface_exists, runway_esxists = aerodrome_row
     no_permission_exception = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=f"You do not have permission to update aerodrome with id {runway_data.aerodrome_id}."
     )
 
-    aerodrome_is_registered = aerodrome.vfr_waypoint
+    aerodrome_is_registered = aerodrome_vfr_waypoint_id is not None
+    aerodrome_created_by_user = aerodrome_creator_id is not None
     user_is_active_admin = current_user.is_active and current_user.is_admin
 
     if aerodrome_is_registered and not user_is_active_admin:
         raise no_permission_exception
 
-    aerodrome_created_by_user = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.waypoint_id == runway_data.aerodrome_id,
-        models.UserWaypoint.creator_id == user_id
-    )).first()
-
     if not aerodrome_is_registered and not aerodrome_created_by_user:
         raise no_permission_exception
 
     # Check if surface exists
-    surface_exists = db_session.query(models.RunwaySurface).filter_by(
-        id=runway_data.surface_id).first()
     if not surface_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -251,15 +261,6 @@ def post_runway(
         )
 
     # Check if runway already exists.
-    runway_esxists = db_session.query(models.Runway).filter(and_(
-        models.Runway.aerodrome_id == runway_data.aerodrome_id,
-        models.Runway.number == runway_data.number,
-        or_(
-            models.Runway.position.is_(None),
-            runway_data.position is None,
-            models.Runway.position == runway_data.position
-        )
-    )).first()
     if runway_esxists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -278,8 +279,9 @@ def post_runway(
     )
 
     db_session.add(new_runway)
+    db_session.flush()
+    new_runway_id = new_runway.id
     db_session.commit()
-    db_session.refresh(new_runway)
 
     # Return runway data
     u = models.UserWaypoint
@@ -288,26 +290,24 @@ def post_runway(
     r = models.Runway
     s = models.RunwaySurface
 
-    runway_result = db_session.query(r, s.surface)\
-        .filter(r.id == new_runway.id)\
-        .join(s, r.surface_id == s.id).first()
-
-    aerodrome_result = db_session.query(a, v.code).filter(a.id == new_runway.aerodrome_id)\
-        .join(v, a.vfr_waypoint_id == v.waypoint_id).first() if aerodrome_is_registered else\
-        db_session.query(a, u.code).filter(a.id == new_runway.aerodrome_id)\
-        .join(u, a.user_waypoint_id == u.waypoint_id).first()
+    runway_result = db_session.query(r, s.surface, func.coalesce(v.code, u.code))\
+        .join(s, r.surface_id == s.id)\
+        .join(a, r.aerodrome_id == a.id)\
+        .outerjoin(v, a.vfr_waypoint_id == v.waypoint_id)\
+        .outerjoin(u, a.user_waypoint_id == u.waypoint_id)\
+        .filter(r.id == new_runway_id).first()
 
     return {
-        "aerodrome": aerodrome_result[1],
+        "aerodrome": runway_result[2],
         **runway_result[0].__dict__,
         "surface": runway_result[1],
-        "created_at_utc": pytz.timezone('UTC').localize((runway_result[0].created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((runway_result[0].last_updated))
+        "created_at_utc": UTC.localize((runway_result[0].created_at)),
+        "last_updated_utc": UTC.localize((runway_result[0].last_updated))
     }
 
 
 @router.post("/csv", status_code=status.HTTP_204_NO_CONTENT)
-async def manage_runways_with_csv_file(
+def manage_runways_with_csv_file(
     csv_file: UploadFile,
     db_session: Session = Depends(get_db),
     _: schemas.TokenData = Depends(auth.validate_admin_user)
@@ -338,8 +338,8 @@ async def manage_runways_with_csv_file(
     csv.check_format(csv_file)
 
     # Get list of schemas
-    dict_list = await csv.extract_data(file=csv_file)
-    headers = get_table_header("runways")
+    dict_list = csv.extract_data_sync(file=csv_file)
+    headers = RUNWAY_HEADERS
 
     # Check all aerodrome codes are valid
     a = models.Aerodrome
@@ -355,36 +355,46 @@ async def manage_runways_with_csv_file(
             detail=f'CSV File is missing the header "{error}"'
         )
 
-    aerodrome_objects = db_session.query(a, v)\
-        .join(v, a.vfr_waypoint_id == v.waypoint_id)\
+    aerodrome_rows = db_session.query(v.code, v.waypoint_id)\
+        .join(a, a.vfr_waypoint_id == v.waypoint_id)\
         .filter(v.code.in_(aerodrome_codes))\
         .all()
 
-    aerodrome_ids_in_db = {v.code: v.waypoint_id for _, v in aerodrome_objects}
+    aerodrome_ids_in_db = {code.upper(): waypoint_id for code, waypoint_id in aerodrome_rows}
 
-    if not len(aerodrome_codes) == len(set(aerodrome_ids_in_db.keys())):
+    if not len(aerodrome_codes) == len(aerodrome_ids_in_db):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Some of the aerodromes are not in the database."
         )
 
+    aerodrome_header = headers["aerodrome"]
+    number_header = headers["number"]
+    position_header = headers["position"]
+    length_header = headers["length_ft"]
+    landing_length_header = headers["landing_length_ft"]
+    intersection_length_header = headers["intersection_departure_length_ft"]
+    surface_header = headers["surface_id"]
+
+    data_list = []
     try:
-        data_list = [schemas.RunwayData(
-            aerodrome_id=int(float(aerodrome_ids_in_db[r[headers["aerodrome"]].strip(
-            ).upper()])),
-            number=int(float(r[headers["number"]])),
-            position=None if not r[headers["position"]]
-            or r[headers["position"]].isspace()
-            else r[headers["position"]],
-            length_ft=int(float(r[headers["length_ft"]])),
-            landing_length_ft=None if not r[headers["landing_length_ft"]]
-            or r[headers["landing_length_ft"]].isspace()
-            else int(float(r[headers["length_ft"]])) - int(float(r[headers["landing_length_ft"]])),
-            intersection_departure_length_ft=None if not r[headers["intersection_departure_length_ft"]]
-            or r[headers["intersection_departure_length_ft"]].isspace()
-            else int(float(r[headers["intersection_departure_length_ft"]])),
-            surface_id=int(float(r[headers["surface_id"]]))
-        ) for r in dict_list]
+        for r in dict_list:
+            position = r[position_header]
+            length_ft = int(float(r[length_header]))
+            landing_length = r[landing_length_header]
+            intersection_length = r[intersection_length_header]
+            data_list.append(schemas.RunwayData(
+                aerodrome_id=aerodrome_ids_in_db[r[aerodrome_header].strip().upper()],
+                number=int(float(r[number_header])),
+                position=None if not position or position.isspace() else position,
+                length_ft=length_ft,
+                landing_length_ft=None if not landing_length or landing_length.isspace()
+                else length_ft - int(float(landing_length)),
+                intersection_departure_length_ft=None if not intersection_length
+                or intersection_length.isspace()
+                else int(float(intersection_length)),
+                surface_id=int(float(r[surface_header]))
+            ))
     except KeyError as error:
         # pylint: disable=raise-missing-from
         raise HTTPException(
@@ -407,9 +417,9 @@ async def manage_runways_with_csv_file(
 
     # Check all surface ids are valid
     surface_ids = {r.surface_id for r in data_list}
-    surfaces_in_db = db_session.query(models.RunwaySurface).filter(
-        models.RunwaySurface.id.in_(surface_ids)).all()
-    if not len(surface_ids) == len(surfaces_in_db):
+    surfaces_in_db = db_session.query(func.count(models.RunwaySurface.id)).filter(
+        models.RunwaySurface.id.in_(surface_ids)).scalar()
+    if not len(surface_ids) == surfaces_in_db:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Some of the surface IDs are not valid."
@@ -417,20 +427,18 @@ async def manage_runways_with_csv_file(
 
     # Delete Runways
     _ = db_session.query(models.Runway).filter(models.Runway.aerodrome_id.in_(
-        list(aerodrome_ids_in_db.values()))).delete(synchronize_session="evaluate")
+        list(aerodrome_ids_in_db.values()))).delete(synchronize_session=False)
 
     # Add data
-    for runway in data_list:
-        new_runway = models.Runway(
-            aerodrome_id=runway.aerodrome_id,
-            number=runway.number,
-            position=runway.position,
-            length_ft=runway.length_ft,
-            landing_length_ft=runway.landing_length_ft,
-            intersection_departure_length_ft=runway.intersection_departure_length_ft,
-            surface_id=runway.surface_id
-        )
-        db_session.add(new_runway)
+    db_session.bulk_insert_mappings(models.Runway, [{
+        "aerodrome_id": runway.aerodrome_id,
+        "number": runway.number,
+        "position": runway.position,
+        "length_ft": runway.length_ft,
+        "landing_length_ft": runway.landing_length_ft,
+        "intersection_departure_length_ft": runway.intersection_departure_length_ft,
+        "surface_id": runway.surface_id
+    } for runway in data_list])
 
     db_session.commit()
 
@@ -479,37 +487,39 @@ def edit_runway(
     """
     Edits a runway
     """
-    # Check if runway exists
-    runway_query = db_session.query(models.Runway).filter(
-        models.Runway.id == runway_id)
-    if not runway_query.first():
+    # Check if runway exists, and get the data to check permissions
+    user_id = current_user.user_id
+    runway_row = db_session.query(
+        models.Runway.aerodrome_id,
+        models.Aerodrome.vfr_waypoint_id,
+        models.UserWaypoint.creator_id
+    ).select_from(models.Runway)\
+        .join(models.Aerodrome, models.Runway.aerodrome_id == models.Aerodrome.id)\
+        .outerjoin(models.UserWaypoint, and_(
+            models.UserWaypoint.waypoint_id == models.Aerodrome.id,
+            models.UserWaypoint.creator_id == user_id
+        ))\
+        .filter(models.Runway.id == runway_id).first()
+    if runway_row is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Please provide a valid runway ID."
         )
 
     # Check if user has permission to update this aerodrome
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-    aerodrome_id = runway_query.first().aerodrome_id
+    aerodrome_id, aerodrome_vfr_waypoint_id, aerodrome_creator_id = runway_row
+    aerodrome_is_registered = aerodrome_vfr_waypoint_id is not None
+    aerodrome_created_by_user = aerodrome_creator_id is not None
+    user_is_active_admin = current_user.is_active and current_user.is_admin
 
     no_permission_exception = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=f"You do not have permission to update aerodrome with id {aerodrome_id}."
     )
 
-    aerodrome_is_registered = db_session.query(models.Aerodrome.vfr_waypoint_id).filter_by(
-        id=aerodrome_id).first()[0] is not None
-    user_is_active_admin = current_user.is_active and current_user.is_admin
-
     if aerodrome_is_registered and not user_is_active_admin:
         raise no_permission_exception
 
-    aerodrome_created_by_user = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.waypoint_id == aerodrome_id,
-        models.UserWaypoint.creator_id == user_id
-    )).first()
-
     if not aerodrome_is_registered and not aerodrome_created_by_user:
         raise no_permission_exception
 
@@ -539,7 +549,7 @@ def edit_runway(
             detail="The runway you are trying to add, already exists."
         )
 
-    runway_query.update({
+    db_session.query(models.Runway).filter(models.Runway.id == runway_id).update({
         "length_ft": runway_data.length_ft,
         "landing_length_ft": runway_data.landing_length_ft,
         "intersection_departure_length_ft": runway_data.intersection_departure_length_ft,
@@ -568,8 +578,8 @@ def edit_runway(
         "aerodrome": aerodrome_result[1],
         **runway_result[0].__dict__,
         "surface": runway_result[1],
-        "created_at_utc": pytz.timezone('UTC').localize((runway_result[0].created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((runway_result[0].last_updated))
+        "created_at_utc": UTC.localize((runway_result[0].created_at)),
+        "last_updated_utc": UTC.localize((runway_result[0].last_updated))
     }
 
 
@@ -603,13 +613,14 @@ def edit_runway_surface(
         models.RunwaySurface.id == surface_id
     )
 
-    if not surface_query.first():
+    # The MySQL dialect counts matched rows, so 0 means the surface does not exist
+    updated = surface_query.update(surface_data.model_dump())
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="The surface ID provided does not exist in the database."
         )
 
-    surface_query.update(surface_data.model_dump())
     db_session.commit()
 
     new_surface = db_session.query(models.RunwaySurface).filter(
@@ -629,45 +640,44 @@ def delete_runway(
     Deletes a runways
     """
 
-    # Check if runway exists
-    db_runway = db_session.query(
-        models.Runway).filter(models.Runway.id == runway_id).first()
-
-    if db_runway is None:
+    # Check if runway exists, and get the data to check permissions
+    user_id = current_user.user_id
+    runway_row = db_session.query(
+        models.Runway.aerodrome_id,
+        models.Aerodrome.vfr_waypoint_id,
+        models.UserWaypoint.creator_id
+    ).select_from(models.Runway)\
+        .join(models.Aerodrome, models.Runway.aerodrome_id == models.Aerodrome.id)\
+        .outerjoin(models.UserWaypoint, and_(
+            models.UserWaypoint.waypoint_id == models.Aerodrome.id,
+            models.UserWaypoint.creator_id == user_id
+        ))\
+        .filter(models.Runway.id == runway_id).first()
+    if runway_row is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="The Runway you're trying to delete is not in the database."
         )
 
-    # Define some variables
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-    user_is_active_admin = current_user.is_active and current_user.is_admin
-
     # Check if user has permission to update this aerodrome
-    runway_query = db_session.query(models.Runway).filter_by(id=runway_id)
-    aerodrome_id = runway_query.first().aerodrome_id
+    aerodrome_id, aerodrome_vfr_waypoint_id, aerodrome_creator_id = runway_row
+    aerodrome_is_registered = aerodrome_vfr_waypoint_id is not None
+    aerodrome_created_by_user = aerodrome_creator_id is not None
+    user_is_active_admin = current_user.is_active and current_user.is_admin
 
     no_permission_exception = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=f"You do not have permission to update aerodrome with id {aerodrome_id}."
     )
 
-    aerodrome_is_registered = db_session.query(models.Aerodrome.vfr_waypoint_id).filter_by(
-        id=aerodrome_id).first()[0] is not None
-
     if aerodrome_is_registered and not user_is_active_admin:
         raise no_permission_exception
 
-    aerodrome_created_by_user = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.waypoint_id == aerodrome_id,
-        models.UserWaypoint.creator_id == user_id
-    )).first()
-
     if not aerodrome_is_registered and not aerodrome_created_by_user:
         raise no_permission_exception
 
-    deleted = runway_query.delete(synchronize_session=False)
+    deleted = db_session.query(models.Runway).filter(models.Runway.id == runway_id)\
+        .delete(synchronize_session=False)
 
     if not deleted:
         raise common_responses.internal_server_error()
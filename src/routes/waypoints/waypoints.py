@@ -14,19 +14,128 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, status, HTTPException
 from pydantic import ValidationError
 import pytz
-from sqlalchemy import and_, or_, not_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, not_, exists, func, literal, select, union_all, Row
+from sqlalchemy.orm import Session, aliased
 
 import auth
 import models
 import schemas
 from utils import common_responses
 from utils.db import get_db
-from functions.data_processing import get_user_id_from_email
-from functions.navigation import get_magnetic_variation_for_waypoint, location_coordinate
+from functions.data_processing import get_aerodrome_status_list
+from functions.navigation import (
+    coordinate_to_radians,
+    get_magnetic_variation_for_waypoint,
+    great_arc_distances_within,
+    is_in_northern_airspace,
+    location_coordinate,
+    waypoints_bounding_box_filter,
+    waypoints_to_radians
+)
 
 router = APIRouter(tags=["Waypoints"])
 
+UTC = pytz.timezone('UTC')
+
+
+def _waypoint_data(waypoint: models.Waypoint) -> dict:
+    """
+    Returns the waypoint columns that are part of the waypoint return schemas.
+    """
+    return {
+        "id": waypoint.id,
+        "lat_degrees": waypoint.lat_degrees,
+        "lat_minutes": waypoint.lat_minutes,
+        "lat_seconds": waypoint.lat_seconds,
+        "lat_direction": waypoint.lat_direction,
+        "lon_degrees": waypoint.lon_degrees,
+        "lon_minutes": waypoint.lon_minutes,
+        "lon_seconds": waypoint.lon_seconds,
+        "lon_direction": waypoint.lon_direction,
+        "magnetic_variation": waypoint.magnetic_variation
+    }
+
+
+def _aerodrome_data(aerodrome: models.Aerodrome) -> dict:
+    """
+    Returns the aerodrome columns that are part of the aerodrome return schemas.
+    """
+    return {
+        "elevation_ft": aerodrome.elevation_ft,
+        "has_taf": aerodrome.has_taf,
+        "has_metar": aerodrome.has_metar,
+        "has_fds": aerodrome.has_fds
+    }
+
+
+def _nearby_waypoint_type(waypoint) -> str:
+    """
+    Returns the type of a row of the nearby waypoints query.
+    """
+    if waypoint.aerodrome_id is not None:
+        return "user aerodrome" if waypoint.is_user else "aerodrome"
+    return "user waypoint" if waypoint.is_user else "waypoint"
+
+
+def _nearby_waypoints(
+    db_session: Session,
+    user_id: int,
+    lat: float,
+    lon: float,
+    distance: float
+) -> List[Row]:
+    """
+    Returns the VFR waypoints, and the user's waypoints, inside the bounding box 
+    of a distance in nautical miles around a latitude and longitude in radians.
+    """
+    a = models.Aerodrome
+    v = models.VfrWaypoint
+    u = models.UserWaypoint
+    w = models.Waypoint
+
+    waypoint_columns = (
+        w.id,
+        w.lat_degrees,
+        w.lat_minutes,
+        w.lat_seconds,
+        w.lat_direction,
+        w.lon_degrees,
+        w.lon_minutes,
+        w.lon_seconds,
+        w.lon_direction
+    )
+    bounding_box_filter = waypoints_bounding_box_filter(lat=lat, lon=lon, distance=distance)
+
+    vfr_waypoints_query = db_session.query(
+        *waypoint_columns,
+        v.code,
+        v.name,
+        literal(False).label("is_user"),
+        a.id.label("aerodrome_id")
+    )\
+        .join(v, w.id == v.waypoint_id)\
+        .outerjoin(a, a.vfr_waypoint_id == v.waypoint_id)\
+        .filter(and_(
+            bounding_box_filter,
+            not_(v.hidden)
+        ))
+
+    user_waypoints_query = db_session.query(
+        *waypoint_columns,
+        u.code,
+        u.name,
+        literal(True).label("is_user"),
+        a.id.label("aerodrome_id")
+    )\
+        .join(u, w.id == u.waypoint_id)\
+        .outerjoin(a, a.user_waypoint_id == u.waypoint_id)\
+        .filter(and_(
+            bounding_box_filter,
+            u.creator_id == user_id
+        ))
+
+    return vfr_waypoints_query.union_all(user_waypoints_query).all()
+
 
 @router.get(
     "/user",
@@ -47,35 +156,30 @@ def get_all_user_waypoints(
     a = models.Aerodrome
     u = models.UserWaypoint
     w = models.Waypoint
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-
-    user_aerodromes = db_session.query(a, u)\
-        .join(u, u.waypoint_id == a.user_waypoint_id)\
-        .filter(u.creator_id == user_id).all()
-
-    aerodrome_ids = [u.waypoint_id for _, u in user_aerodromes]
+    user_id = current_user.user_id
 
     user_waypoints = db_session.query(w, u)\
         .join(u, w.id == u.waypoint_id)\
+        .outerjoin(a, a.user_waypoint_id == u.waypoint_id)\
         .order_by(u.name)\
         .filter(and_(
             u.creator_id == user_id,
-            u.waypoint_id.notin_(aerodrome_ids),
+            a.user_waypoint_id.is_(None),
             or_(
                 not_(waypoint_id),
                 w.id == waypoint_id
             )
-        )).all()
-
-    limit = len(user_waypoints) if limit == -1 else limit
+        ))\
+        .offset(start)\
+        .limit(None if limit == -1 else limit).all()
 
     return [{
-        **w.__dict__,
-        **v.__dict__,
-        "created_at_utc": pytz.timezone('UTC').localize((v.created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((v.last_updated))
-    } for w, v in user_waypoints[start: start + limit]]
+        **_waypoint_data(w),
+        "code": v.code,
+        "name": v.name,
+        "created_at_utc": UTC.localize((v.created_at)),
+        "last_updated_utc": UTC.localize((v.last_updated))
+    } for w, v in user_waypoints]
 
 
 @router.get(
@@ -97,35 +201,49 @@ def get_all_vfr_waypoints(
     v = models.VfrWaypoint
     w = models.Waypoint
 
-    aerodromes_list_from_db = db_session.query(a).filter(
-        not_(a.vfr_waypoint_id.is_(None))).all()
-
-    aerodromes = [item.vfr_waypoint_id for item in aerodromes_list_from_db]
-
     user_is_active_admin = current_user.is_active and current_user.is_admin
-    query_results = db_session.query(w, v)\
+    query_results = db_session.query(
+        w.id,
+        w.lat_degrees,
+        w.lat_minutes,
+        w.lat_seconds,
+        w.lat_direction,
+        w.lon_degrees,
+        w.lon_minutes,
+        w.lon_seconds,
+        w.lon_direction,
+        w.magnetic_variation,
+        v.code,
+        v.name,
+        v.hidden,
+        v.created_at,
+        v.last_updated
+    )\
         .filter(and_(
             or_(
                 not_(waypoint_id),
                 w.id == waypoint_id
             ),
-            w.id.notin_(aerodromes),
+            a.vfr_waypoint_id.is_(None),
             or_(
                 not_(v.hidden),
                 user_is_active_admin
             )
         ))\
-        .join(v, w.id == v.waypoint_id).order_by(v.name).all()
+        .join(v, w.id == v.waypoint_id)\
+        .outerjoin(a, a.vfr_waypoint_id == v.waypoint_id)\
+        .order_by(v.name)\
+        .offset(start)\
+        .limit(None if limit == -1 else limit).all()
 
-    limit = len(query_results) if limit == -1 else limit
     return [{
-        **w.__dict__,
-        "code": v.code,
-        "name": v.name,
-        "hidden": v.hidden if user_is_active_admin else None,
-        "created_at_utc": pytz.timezone('UTC').localize((v.created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((v.last_updated))
-    } for w, v in query_results[start: start + limit]]
+        **_waypoint_data(waypoint),
+        "code": waypoint.code,
+        "name": waypoint.name,
+        "hidden": waypoint.hidden if user_is_active_admin else None,
+        "created_at_utc": UTC.localize((waypoint.created_at)),
+        "last_updated_utc": UTC.localize((waypoint.last_updated))
+    } for waypoint in query_results]
 
 
 @router.get(
@@ -158,63 +276,43 @@ def get_all_nearby_waypoints(
         )
 
     # Get all waypoints
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
     lat_radians = math.radians(lat)
     lon_radians = math.radians(lon)
 
-    a = models.Aerodrome
-    v = models.VfrWaypoint
-    u = models.UserWaypoint
-    w = models.Waypoint
+    waypoints_query = _nearby_waypoints(
+        db_session=db_session,
+        user_id=current_user.user_id,
+        lat=lat_radians,
+        lon=lon_radians,
+        distance=distance
+    )
 
-    waypoints_query = db_session.query(w, v, u, a)\
-        .filter(and_(
-            or_(
-                v.waypoint_id.is_(None),
-                not_(v.hidden),
-            ),
-            or_(
-                u.waypoint_id.is_(None),
-                u.creator_id == user_id
-            ),
-            or_(
-                not_(u.waypoint_id.is_(None)),
-                not_(v.waypoint_id.is_(None))
-            ),
+    if not waypoints_query:
+        return []
 
-        ))\
-        .outerjoin(v, w.id == v.waypoint_id)\
-        .outerjoin(u, w.id == u.waypoint_id)\
-        .outerjoin(a, or_(v.waypoint_id == a.vfr_waypoint_id, u.waypoint_id == a.user_waypoint_id))\
-        .all()
+    # Find distances to all waypoints at once
+    lats, lons = waypoints_to_radians(waypoints_query)
+    indices, distances = great_arc_distances_within(
+        lats=lats, lons=lons, to_lat=lat_radians, to_lon=lon_radians, distance=distance)
 
     # Return waypoints
-    waypoints_list = []
-    for waypoint_query in waypoints_query:
-        is_user = waypoint_query[2] is not None
-        is_aerodrome = waypoint_query[3] is not None
-
-        if waypoint_query[0].great_arc_to(to_lat=lat_radians, to_lon=lon_radians) <= distance:
-            waypoints_list.append({
-                "id": waypoint_query[0].id,
-                "type": "user aerodrome" if is_aerodrome and is_user
-                else "aerodrome" if is_aerodrome
-                else "user waypoint" if is_user
-                else "waypoint",
-                # pylint: disable=no-value-for-parameter
-                "distance": waypoint_query[0].great_arc_to(to_lat=lat_radians, to_lon=lon_radians),
-                "code": waypoint_query[2].code if is_user else waypoint_query[1].code,
-                "name": waypoint_query[2].name if is_user else waypoint_query[1].name,
-                "lat_degrees": waypoint_query[0].lat_degrees,
-                "lat_minutes": waypoint_query[0].lat_minutes,
-                "lat_seconds": waypoint_query[0].lat_seconds,
-                "lat_direction": waypoint_query[0].lat_direction,
-                "lon_degrees": waypoint_query[0].lon_degrees,
-                "lon_minutes": waypoint_query[0].lon_minutes,
-                "lon_seconds": waypoint_query[0].lon_seconds,
-                "lon_direction": waypoint_query[0].lon_direction,
-            })
+    waypoints_list = [{
+        "id": waypoint.id,
+        "type": _nearby_waypoint_type(waypoint),
+        "distance": float(waypoint_distance),
+        "code": waypoint.code,
+        "name": waypoint.name,
+        "lat_degrees": waypoint.lat_degrees,
+        "lat_minutes": waypoint.lat_minutes,
+        "lat_seconds": waypoint.lat_seconds,
+        "lat_direction": waypoint.lat_direction,
+        "lon_degrees": waypoint.lon_degrees,
+        "lon_minutes": waypoint.lon_minutes,
+        "lon_seconds": waypoint.lon_seconds,
+        "lon_direction": waypoint.lon_direction,
+    } for waypoint, waypoint_distance in zip(
+        (waypoints_query[index] for index in indices), distances
+    )]
 
     return sorted(waypoints_list, key=lambda x: x["distance"])
 
@@ -234,20 +332,53 @@ def get_all_aerodromes(
     """
     Returns all aerodromes
     """
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
-    rs = models.RunwaySurface
     s = models.AerodromeStatus
     r = models.Runway
+    rs = models.RunwaySurface
     a = models.Aerodrome
     v = models.VfrWaypoint
     u = models.UserWaypoint
     w = models.Waypoint
 
     user_is_active_admin = current_user.is_active and current_user.is_admin
-    registered_aerodromes = db_session.query(w, v, a, s.status)\
-        .filter(and_(
+
+    def aerodrome_columns(waypoint_type, registered: bool):
+        """
+        Returns the columns of the aerodromes query, for registered or private aerodromes.
+        """
+        return (
+            w.id.label("id"),
+            w.lat_degrees.label("lat_degrees"),
+            w.lat_minutes.label("lat_minutes"),
+            w.lat_seconds.label("lat_seconds"),
+            w.lat_direction.label("lat_direction"),
+            w.lon_degrees.label("lon_degrees"),
+            w.lon_minutes.label("lon_minutes"),
+            w.lon_seconds.label("lon_seconds"),
+            w.lon_direction.label("lon_direction"),
+            w.magnetic_variation.label("magnetic_variation"),
+            waypoint_type.code.label("code"),
+            waypoint_type.name.label("name"),
+            (v.hidden if registered else literal(None)).label("hidden"),
+            a.id.label("aerodrome_id"),
+            a.elevation_ft.label("elevation_ft"),
+            a.has_taf.label("has_taf"),
+            a.has_metar.label("has_metar"),
+            a.has_fds.label("has_fds"),
+            s.status.label("status"),
+            literal(registered).label("registered"),
+            a.created_at.label("created_at"),
+            a.last_updated.label("last_updated")
+        )
+
+    registered_aerodromes = select(*aerodrome_columns(v, registered=True))\
+        .select_from(w)\
+        .join(v, w.id == v.waypoint_id)\
+        .join(a, v.waypoint_id == a.vfr_waypoint_id)\
+        .join(s, a.status_id == s.id)\
+        .where(and_(
             or_(
                 not_(v.hidden),
                 user_is_active_admin
@@ -256,61 +387,61 @@ def get_all_aerodromes(
                 not_(aerodrome_id),
                 w.id == aerodrome_id
             )
-        ))\
-        .join(v, w.id == v.waypoint_id)\
-        .join(a, v.waypoint_id == a.vfr_waypoint_id)\
-        .join(s, a.status_id == s.id).all()
+        ))
 
-    private_aerodromes = db_session.query(w, u, a, s.status)\
-        .filter(and_(
+    private_aerodromes = select(*aerodrome_columns(u, registered=False))\
+        .select_from(w)\
+        .join(u, w.id == u.waypoint_id)\
+        .join(a, u.waypoint_id == a.user_waypoint_id)\
+        .join(s, a.status_id == s.id)\
+        .where(and_(
             or_(
                 not_(aerodrome_id),
                 w.id == aerodrome_id
             ),
             u.creator_id == user_id
-        ))\
-        .join(u, w.id == u.waypoint_id)\
-        .join(a, u.waypoint_id == a.user_waypoint_id)\
-        .join(s, a.status_id == s.id).all()
-
-    aerodromes = registered_aerodromes + private_aerodromes
-    aerodrome_ids = [a[2].id for a in aerodromes]
-
-    runways = db_session.query(r, rs.surface)\
-        .filter(r.aerodrome_id.in_(aerodrome_ids))\
-        .join(rs, r.surface_id == rs.id).all()
+        ))
+
+    # Private aerodromes go first, then registered ones, both sorted by name
+    aerodromes = db_session.execute(
+        union_all(private_aerodromes, registered_aerodromes)
+        .order_by("registered", "name")
+        .offset(start)
+        .limit(None if limit == -1 else limit)
+    ).all()
+
+    if not aerodromes:
+        return []
+
+    runways = {aerodrome.aerodrome_id: [] for aerodrome in aerodromes}
+    for runway, surface in db_session.query(r, rs.surface)\
+            .join(rs, r.surface_id == rs.id)\
+            .filter(r.aerodrome_id.in_(list(runways))).all():
+        runways[runway.aerodrome_id].append(schemas.RunwayInAerodromeReturn.model_construct(
+            id=runway.id,
+            number=runway.number,
+            position=runway.position,
+            length_ft=runway.length_ft,
+            landing_length_ft=runway.landing_length_ft,
+            intersection_departure_length_ft=runway.intersection_departure_length_ft,
+            surface=surface,
+            surface_id=runway.surface_id,
+            created_at_utc=UTC.localize((runway.created_at)),
+            last_updated_utc=UTC.localize((runway.last_updated)),
+        ))
 
-    # pylint: disable=cell-var-from-loop
-    aerodromes = [{
-        **w.__dict__,
-        "code": v.code,
-        "name": v.name,
-        "hidden": v.hidden if a.vfr_waypoint_id is not None and user_is_active_admin else None,
-        **a.__dict__,
-        "status": s,
-        "registered": a.vfr_waypoint_id is not None,
-        "created_at_utc": pytz.timezone('UTC').localize((a.created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((a.last_updated)),
-        "runways": [
-            schemas.RunwayInAerodromeReturn(
-                id=r.id,
-                number=r.number,
-                position=r.position,
-                length_ft=r.length_ft,
-                landing_length_ft=r.landing_length_ft,
-                intersection_departure_length_ft=r.intersection_departure_length_ft,
-                surface=rs,
-                surface_id=r.surface_id,
-                created_at_utc=pytz.timezone('UTC').localize((r.created_at)),
-                last_updated_utc=pytz.timezone(
-                    'UTC').localize((r.last_updated)),
-            ) for r, rs in filter(lambda i: i[0].aerodrome_id == a.id, runways)
-        ]
-    } for w, v, a, s in aerodromes]
-
-    aerodromes.sort(key=lambda a: (a["registered"], a["name"]))
-    limit = len(aerodromes) if limit == -1 else limit
-    return aerodromes[start: start + limit]
+    return [{
+        **_waypoint_data(aerodrome),
+        "code": aerodrome.code,
+        "name": aerodrome.name,
+        "hidden": aerodrome.hidden if aerodrome.registered and user_is_active_admin else None,
+        **_aerodrome_data(aerodrome),
+        "status": aerodrome.status,
+        "registered": bool(aerodrome.registered),
+        "created_at_utc": UTC.localize((aerodrome.created_at)),
+        "last_updated_utc": UTC.localize((aerodrome.last_updated)),
+        "runways": runways[aerodrome.aerodrome_id]
+    } for aerodrome in aerodromes]
 
 
 @router.get(
@@ -327,10 +458,8 @@ def get_all_aerodrome_status(
     Returns all Aerodrome status
     """
 
-    return db_session.query(models.AerodromeStatus.id, models.AerodromeStatus.status).filter(or_(
-        not_(status_id),
-        models.AerodromeStatus.id == status_id
-    )).order_by(models.AerodromeStatus.status).all()
+    return [aerodrome_status for aerodrome_status in get_aerodrome_status_list(db_session)
+            if not status_id or aerodrome_status["id"] == status_id]
 
 
 @router.post(
@@ -347,14 +476,13 @@ def post_new_user_waypoint(
     Creates a new user waypoint
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
 
-    exists = db_session.query(models.UserWaypoint).filter(and_(
+    code_exists = db_session.query(exists().where(and_(
         models.UserWaypoint.creator_id == user_id,
-        models.UserWaypoint.code == waypoint.code)
-    ).first()
-    if exists:
+        models.UserWaypoint.code == waypoint.code
+    ))).scalar()
+    if code_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Waypoint with code {waypoint.code} already exists. Try using a different code."
@@ -371,18 +499,21 @@ def post_new_user_waypoint(
         lon_direction=waypoint.lon_direction,
         magnetic_variation=waypoint.magnetic_variation,
     )
-    new_waypoint.in_north_airspace = new_waypoint.is_in_northern_airspace()
+    new_waypoint.in_north_airspace = is_in_northern_airspace(
+        lat=new_waypoint.lat(),
+        lon=new_waypoint.lon()
+    )
     new_waypoint.magnetic_variation = get_magnetic_variation_for_waypoint(
         waypoint=new_waypoint,
         db_session=db_session
     )
 
     db_session.add(new_waypoint)
-    db_session.commit()
-    db_session.refresh(new_waypoint)
+    db_session.flush()
+    new_waypoint_id = new_waypoint.id
 
     new_user_waypoint = models.UserWaypoint(
-        waypoint_id=new_waypoint.id,
+        waypoint_id=new_waypoint_id,
         code=waypoint.code,
         name=waypoint.name,
         creator_id=user_id
@@ -390,14 +521,20 @@ def post_new_user_waypoint(
 
     db_session.add(new_user_waypoint)
     db_session.commit()
-    new_user_waypoint = db_session.query(models.UserWaypoint).filter_by(
-        waypoint_id=new_waypoint.id).first()
+
+    # Read back both rows at once, to get the timestamps set by the database
+    w = models.Waypoint
+    u = models.UserWaypoint
+    new_waypoint, new_user_waypoint = db_session.query(w, u)\
+        .join(u, w.id == u.waypoint_id)\
+        .filter(w.id == new_waypoint_id).first()
 
     return {
-        **new_user_waypoint.__dict__,
-        **new_waypoint.__dict__,
-        "created_at_utc": pytz.timezone('UTC').localize((new_user_waypoint.created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((new_user_waypoint.last_updated))
+        **_waypoint_data(new_waypoint),
+        "code": new_user_waypoint.code,
+        "name": new_user_waypoint.name,
+        "created_at_utc": UTC.localize((new_user_waypoint.created_at)),
+        "last_updated_utc": UTC.localize((new_user_waypoint.last_updated))
     }
 
 
@@ -415,21 +552,25 @@ def post_private_aerodrome(
     Creates a new private aerodrome
     """
 
-    status_exists = db_session.query(models.AerodromeStatus).filter_by(
-        id=aerodrome.status).first()
-    if not status_exists:
+    user_id = current_user.user_id
+
+    # Check the status and the code in one query
+    status_name, waypoint_exists = db_session.query(
+        db_session.query(models.AerodromeStatus.status)
+        .filter(models.AerodromeStatus.id == aerodrome.status)
+        .scalar_subquery(),
+        exists().where(and_(
+            models.UserWaypoint.creator_id == user_id,
+            models.UserWaypoint.code == aerodrome.code
+        ))
+    ).one()
+
+    if status_name is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Please provide a valid status ID."
         )
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-
-    waypoint_exists = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.creator_id == user_id,
-        models.UserWaypoint.code == aerodrome.code)
-    ).first()
     if waypoint_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -447,26 +588,29 @@ def post_private_aerodrome(
         lon_direction=aerodrome.lon_direction,
         magnetic_variation=aerodrome.magnetic_variation,
     )
-    new_waypoint.in_north_airspace = new_waypoint.is_in_northern_airspace()
+    new_waypoint.in_north_airspace = is_in_northern_airspace(
+        lat=new_waypoint.lat(),
+        lon=new_waypoint.lon()
+    )
     new_waypoint.magnetic_variation = get_magnetic_variation_for_waypoint(
         waypoint=new_waypoint,
         db_session=db_session
     )
 
     db_session.add(new_waypoint)
-    db_session.commit()
-    db_session.refresh(new_waypoint)
+    db_session.flush()
+    new_waypoint_id = new_waypoint.id
 
     new_user_waypoint = models.UserWaypoint(
-        waypoint_id=new_waypoint.id,
+        waypoint_id=new_waypoint_id,
         code=aerodrome.code,
         name=aerodrome.name,
         creator_id=user_id
     )
 
     new_aerodrome = models.Aerodrome(
-        id=new_waypoint.id,
-        user_waypoint_id=new_waypoint.id,
+        id=new_waypoint_id,
+        user_waypoint_id=new_waypoint_id,
         has_taf=False,
         has_metar=False,
         has_fds=False,
@@ -478,25 +622,25 @@ def post_private_aerodrome(
     db_session.add(new_aerodrome)
     db_session.commit()
 
-    s = models.AerodromeStatus
+    # Read back all rows at once, to get the timestamps set by the database
     a = models.Aerodrome
     u = models.UserWaypoint
     w = models.Waypoint
 
-    return_aerodrome_data = db_session.query(w, u, a, s.status)\
-        .filter(w.id == new_waypoint.id)\
+    return_aerodrome_data = db_session.query(w, u, a)\
+        .filter(w.id == new_waypoint_id)\
         .join(u, w.id == u.waypoint_id)\
-        .join(a, u.waypoint_id == a.user_waypoint_id)\
-        .join(s, a.status_id == s.id).first()
+        .join(a, u.waypoint_id == a.user_waypoint_id).first()
 
     return {
-        **return_aerodrome_data[0].__dict__,
-        **return_aerodrome_data[1].__dict__,
-        **return_aerodrome_data[2].__dict__,
-        "status": return_aerodrome_data[3],
+        **_waypoint_data(return_aerodrome_data[0]),
+        "code": return_aerodrome_data[1].code,
+        "name": return_aerodrome_data[1].name,
+        **_aerodrome_data(return_aerodrome_data[2]),
+        "status": status_name,
         "registered": False,
-        "created_at_utc": pytz.timezone('UTC').localize((return_aerodrome_data[2].created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((return_aerodrome_data[2].last_updated))
+        "created_at_utc": UTC.localize((return_aerodrome_data[2].created_at)),
+        "last_updated_utc": UTC.localize((return_aerodrome_data[2].last_updated))
     }
 
 
@@ -515,80 +659,101 @@ def edit_user_waypoint(
     Edits a user waypoint
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
+    user_id = current_user.user_id
+    w = models.Waypoint
+    u = models.UserWaypoint
 
-    user_waypoint_exists = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.waypoint_id == waypoint_id,
-        models.UserWaypoint.creator_id == user_id
-    )).first()
+    # Get the stored values the response needs, and that the update doesn't set
+    other_waypoint = aliased(models.UserWaypoint)
+    user_waypoint = db_session.query(
+        u.created_at,
+        w.magnetic_variation,
+        exists().where(and_(
+            other_waypoint.code == waypoint.code,
+            not_(other_waypoint.waypoint_id == waypoint_id)
+        )).label("duplicated_code"),
+        func.utc_timestamp().label("last_updated")
+    )\
+        .join(w, u.waypoint_id == w.id)\
+        .filter(and_(
+            u.waypoint_id == waypoint_id,
+            u.creator_id == user_id
+        )).first()
 
-    if not user_waypoint_exists:
+    if user_waypoint is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="The waypoint you're trying to update is not in the database."
         )
 
-    duplicated_code = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.code == waypoint.code,
-        not_(models.UserWaypoint.waypoint_id == waypoint_id)
-    )).first()
-
-    if duplicated_code:
+    if user_waypoint.duplicated_code:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Waypoint with code {waypoint.code} already exists."
         )
 
-    new_waypoint = models.Waypoint(
-        lat_degrees=waypoint.lat_degrees,
-        lat_minutes=waypoint.lat_minutes,
-        lat_seconds=waypoint.lat_seconds,
-        lat_direction=waypoint.lat_direction,
-        lon_degrees=waypoint.lon_degrees,
-        lon_minutes=waypoint.lon_minutes,
-        lon_seconds=waypoint.lon_seconds,
-        lon_direction=waypoint.lon_direction,
-    )
-    new_waypoint.in_north_airspace = new_waypoint.is_in_northern_airspace()
-
     update_waypoint_data = {
-        "lat_degrees": new_waypoint.lat_degrees,
-        "lat_minutes": new_waypoint.lat_minutes,
-        "lat_seconds": new_waypoint.lat_seconds,
-        "lat_direction": new_waypoint.lat_direction,
-        "lon_degrees": new_waypoint.lon_degrees,
-        "lon_minutes": new_waypoint.lon_minutes,
-        "lon_seconds": new_waypoint.lon_seconds,
-        "lon_direction": new_waypoint.lon_direction,
-        "in_north_airspace": new_waypoint.in_north_airspace
+        "lat_degrees": waypoint.lat_degrees,
+        "lat_minutes": waypoint.lat_minutes,
+        "lat_seconds": waypoint.lat_seconds,
+        "lat_direction": waypoint.lat_direction,
+        "lon_degrees": waypoint.lon_degrees,
+        "lon_minutes": waypoint.lon_minutes,
+        "lon_seconds": waypoint.lon_seconds,
+        "lon_direction": waypoint.lon_direction,
+        "in_north_airspace": is_in_northern_airspace(
+            lat=coordinate_to_radians(
+                degrees=waypoint.lat_degrees,
+                minutes=waypoint.lat_minutes,
+                seconds=waypoint.lat_seconds,
+                direction=waypoint.lat_direction
+            ),
+            lon=coordinate_to_radians(
+                degrees=waypoint.lon_degrees,
+                minutes=waypoint.lon_minutes,
+                seconds=waypoint.lon_seconds,
+                direction=waypoint.lon_direction
+            )
+        )
     }
+    magnetic_variation = user_waypoint.magnetic_variation
     if waypoint.magnetic_variation is not None:
         update_waypoint_data["magnetic_variation"] = waypoint.magnetic_variation
+        magnetic_variation = waypoint.magnetic_variation
 
-    db_session.query(models.Waypoint).filter(models.Waypoint.id == waypoint_id).update(
-        update_waypoint_data
-    )
+    # The update timestamp comes from the database clock, read in the check query,
+    # so the response can be built without re-reading the rows
+    last_updated = user_waypoint.last_updated
 
-    db_session.query(models.UserWaypoint).filter(
-        models.UserWaypoint.waypoint_id == waypoint_id).update({
-            "code": waypoint.code,
-            "name": waypoint.name,
-            "creator_id": user_id
-        })
+    db_session.query(w).filter(w.id == waypoint_id).update({
+        **update_waypoint_data,
+        "last_updated": last_updated
+    })
 
-    db_session.commit()
+    db_session.query(u).filter(u.waypoint_id == waypoint_id).update({
+        "code": waypoint.code,
+        "name": waypoint.name,
+        "creator_id": user_id,
+        "last_updated": last_updated
+    })
 
-    w = models.Waypoint
-    u = models.UserWaypoint
+    db_session.commit()
 
-    new_waypoint = db_session.query(w, u).join(
-        w, u.waypoint_id == w.id).filter(u.waypoint_id == waypoint_id).first()
     return {
-        **new_waypoint[0].__dict__,
-        **new_waypoint[1].__dict__,
-        "created_at_utc": pytz.timezone('UTC').localize((new_waypoint[1].created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((new_waypoint[1].last_updated))
+        "id": waypoint_id,
+        "lat_degrees": waypoint.lat_degrees,
+        "lat_minutes": waypoint.lat_minutes,
+        "lat_seconds": waypoint.lat_seconds,
+        "lat_direction": waypoint.lat_direction,
+        "lon_degrees": waypoint.lon_degrees,
+        "lon_minutes": waypoint.lon_minutes,
+        "lon_seconds": waypoint.lon_seconds,
+        "lon_direction": waypoint.lon_direction,
+        "magnetic_variation": magnetic_variation,
+        "code": waypoint.code,
+        "name": waypoint.name,
+        "created_at_utc": UTC.localize(user_waypoint.created_at),
+        "last_updated_utc": UTC.localize(last_updated)
     }
 
 
@@ -607,113 +772,133 @@ def edit_private_aerodrome(
     Edits a private aerodrome
     """
 
-    aerodrome_query = db_session.query(models.Aerodrome).filter(
-        models.Aerodrome.user_waypoint_id == aerodrome_id
-    )
-    if not aerodrome_query.first():
+    # Get all the data to check the request in one query
+    user_id = current_user.user_id
+    a = models.Aerodrome
+    u = models.UserWaypoint
+    w = models.Waypoint
+    other_waypoint = aliased(models.UserWaypoint)
+    aerodrome_row = db_session.query(
+        u.waypoint_id,
+        db_session.query(models.AerodromeStatus.status)
+        .filter(models.AerodromeStatus.id == aerodrome.status)
+        .scalar_subquery(),
+        exists().where(and_(
+            other_waypoint.code == aerodrome.code,
+            other_waypoint.creator_id == user_id,
+            not_(other_waypoint.waypoint_id == aerodrome_id)
+        )),
+        w.magnetic_variation,
+        a.has_taf,
+        a.has_metar,
+        a.has_fds,
+        a.created_at,
+        func.utc_timestamp()
+    ).select_from(a)\
+        .join(w, a.user_waypoint_id == w.id)\
+        .outerjoin(u, and_(
+            u.waypoint_id == a.user_waypoint_id,
+            u.creator_id == user_id
+        ))\
+        .filter(a.user_waypoint_id == aerodrome_id).first()
+
+    if aerodrome_row is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid ID, the waypoint ID you provided is not an aerodrome."
         )
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-    user_waypoint_query = db_session.query(models.UserWaypoint).filter(
-        and_(
-            models.UserWaypoint.waypoint_id == aerodrome_id,
-            models.UserWaypoint.creator_id == user_id
-        )
-    )
-    if not user_waypoint_query.first():
+    user_waypoint_id, status_name, duplicated_code, *stored_data = aerodrome_row
+    magnetic_variation, has_taf, has_metar, has_fds, created_at, last_updated = stored_data
+    if user_waypoint_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid ID, you do not have permissio to edit this waypoint."
         )
 
-    status_exists = db_session.query(models.AerodromeStatus).filter_by(
-        id=aerodrome.status).first()
-    if not status_exists:
+    if status_name is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Please provide a valid status ID."
         )
 
-    duplicated_code = db_session.query(models.UserWaypoint).filter(and_(
-        models.UserWaypoint.code == aerodrome.code,
-        models.UserWaypoint.creator_id == user_id,
-        not_(models.UserWaypoint.waypoint_id == aerodrome_id)
-    )).first()
-
     if duplicated_code:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Aerodrome with code {aerodrome.code} already exists."
         )
 
-    new_waypoint = models.Waypoint(
-        lat_degrees=aerodrome.lat_degrees,
-        lat_minutes=aerodrome.lat_minutes,
-        lat_seconds=aerodrome.lat_seconds,
-        lat_direction=aerodrome.lat_direction,
-        lon_degrees=aerodrome.lon_degrees,
-        lon_minutes=aerodrome.lon_minutes,
-        lon_seconds=aerodrome.lon_seconds,
-        lon_direction=aerodrome.lon_direction,
-    )
-    new_waypoint.in_north_airspace = new_waypoint.is_in_northern_airspace()
     update_waypoint_data = {
-        "lat_degrees": new_waypoint.lat_degrees,
-        "lat_minutes": new_waypoint.lat_minutes,
-        "lat_seconds": new_waypoint.lat_seconds,
-        "lat_direction": new_waypoint.lat_direction,
-        "lon_degrees": new_waypoint.lon_degrees,
-        "lon_minutes": new_waypoint.lon_minutes,
-        "lon_seconds": new_waypoint.lon_seconds,
-        "lon_direction": new_waypoint.lon_direction,
-        "in_north_airspace": new_waypoint.in_north_airspace
+        "lat_degrees": aerodrome.lat_degrees,
+        "lat_minutes": aerodrome.lat_minutes,
+        "lat_seconds": aerodrome.lat_seconds,
+        "lat_direction": aerodrome.lat_direction,
+        "lon_degrees": aerodrome.lon_degrees,
+        "lon_minutes": aerodrome.lon_minutes,
+        "lon_seconds": aerodrome.lon_seconds,
+        "lon_direction": aerodrome.lon_direction,
+        "in_north_airspace": is_in_northern_airspace(
+            lat=coordinate_to_radians(
+                degrees=aerodrome.lat_degrees,
+                minutes=aerodrome.lat_minutes,
+                seconds=aerodrome.lat_seconds,
+                direction=aerodrome.lat_direction
+            ),
+            lon=coordinate_to_radians(
+                degrees=aerodrome.lon_degrees,
+                minutes=aerodrome.lon_minutes,
+                seconds=aerodrome.lon_seconds,
+                direction=aerodrome.lon_direction
+            )
+        )
     }
     if aerodrome.magnetic_variation is not None:
         update_waypoint_data["magnetic_variation"] = aerodrome.magnetic_variation
-
-    db_session.query(models.Waypoint).filter(
-        models.Waypoint.id == aerodrome_id).update(update_waypoint_data)
-
-    db_session.query(models.UserWaypoint).filter(
-        models.UserWaypoint.waypoint_id == aerodrome_id).update({
-            "code": aerodrome.code,
-            "name": aerodrome.name,
-            "creator_id": user_id
-        })
-
-    aerodrome_data = {
-        "elevation_ft": aerodrome.elevation_ft
-    }
-
-    db_session.query(models.Aerodrome).filter(
-        models.Aerodrome.user_waypoint_id == aerodrome_id
-    ).update({**aerodrome_data, "status_id": aerodrome.status})
+        magnetic_variation = aerodrome.magnetic_variation
+
+    # The update timestamp comes from the database clock, read in the check query,
+    # so the response can be built without re-reading the rows
+    db_session.query(w).filter(w.id == aerodrome_id).update({
+        **update_waypoint_data,
+        "last_updated": last_updated
+    })
+
+    db_session.query(u).filter(u.waypoint_id == aerodrome_id).update({
+        "code": aerodrome.code,
+        "name": aerodrome.name,
+        "creator_id": user_id,
+        "last_updated": last_updated
+    })
+
+    db_session.query(a).filter(a.user_waypoint_id == aerodrome_id).update({
+        "elevation_ft": aerodrome.elevation_ft,
+        "status_id": aerodrome.status,
+        "last_updated": last_updated
+    })
 
     db_session.commit()
 
-    s = models.AerodromeStatus
-    a = models.Aerodrome
-    u = models.UserWaypoint
-    w = models.Waypoint
-
-    data = db_session.query(w, u, a, s.status)\
-        .join(u, w.id == u.waypoint_id)\
-        .join(a, u.waypoint_id == a.user_waypoint_id)\
-        .join(s, a.status_id == s.id)\
-        .filter(w.id == aerodrome_id).first()
-
     return {
-        **data[0].__dict__,
-        **data[1].__dict__,
-        **data[2].__dict__,
-        "status": data[3],
+        "id": aerodrome_id,
+        "lat_degrees": aerodrome.lat_degrees,
+        "lat_minutes": aerodrome.lat_minutes,
+        "lat_seconds": aerodrome.lat_seconds,
+        "lat_direction": aerodrome.lat_direction,
+        "lon_degrees": aerodrome.lon_degrees,
+        "lon_minutes": aerodrome.lon_minutes,
+        "lon_seconds": aerodrome.lon_seconds,
+        "lon_direction": aerodrome.lon_direction,
+        "magnetic_variation": magnetic_variation,
+        "code": aerodrome.code,
+        "name": aerodrome.name,
+        "elevation_ft": aerodrome.elevation_ft,
+        "has_taf": has_taf,
+        "has_metar": has_metar,
+        "has_fds": has_fds,
+        "status": status_name,
         "registered": False,
-        "created_at_utc": pytz.timezone('UTC').localize((data[2].created_at)),
-        "last_updated_utc": pytz.timezone('UTC').localize((data[2].last_updated))
+        "created_at_utc": UTC.localize(created_at),
+        "last_updated_utc": UTC.localize(last_updated)
     }
 
 
@@ -727,12 +912,11 @@ def delete_user_waypoint_or_private_aerodrome(
     Deletes a user waypoint or private aerodrome
     """
 
-    user_id = get_user_id_from_email(
-        email=current_user.email, db_session=db_session)
-    waypoint_exists = db_session.query(models.UserWaypoint).filter(and_(
+    user_id = current_user.user_id
+    waypoint_exists = db_session.query(exists().where(and_(
         models.UserWaypoint.waypoint_id == waypoint_id,
         models.UserWaypoint.creator_id == user_id
-    )).first()
+    ))).scalar()
 
     if not waypoint_exists:
         raise HTTPException(
@@ -0,0 +1,37 @@
+"""
+Pydantic common schema types
+
+This module defines the constrained types shared by more than one schemas module.
+
+Usage: 
+- Import the required type to annotate the schema fields.
+"""
+
+from typing import Annotated, Literal
+
+from pydantic import BeforeValidator, StringConstraints
+
+from functions.data_processing import to_upper_case
+
+
+FlightWaypointCode = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    to_upper=True,
+    min_length=2,
+    max_length=50,
+    pattern=r"^[-a-zA-Z0-9']+$"
+)]
+RunwayPosition = Annotated[str, StringConstraints(
+    to_upper=True,
+    min_length=1,
+    max_length=1,
+    pattern=r"^[rRlLcC]$"
+)]
+RunwaySurfaceName = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    min_length=2,
+    max_length=50,
+    pattern=r"^[-a-zA-Z ']+$"
+)]
+LatitudeDirection = Annotated[Literal['N', 'S'], BeforeValidator(to_upper_case)]
+LongitudeDirection = Annotated[Literal['E', 'W'], BeforeValidator(to_upper_case)]
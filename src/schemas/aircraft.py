@@ -8,11 +8,72 @@ Usage:
 
 """
 
-from typing import Optional, List, Dict, Any
-
-from pydantic import BaseModel, constr, conint, confloat, field_validator, model_validator, AwareDatetime
-
-from functions.data_processing import clean_string
+from typing import Annotated, Optional, List
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveInt,
+    AwareDatetime,
+    StringConstraints,
+    TypeAdapter
+)
+from pydantic.dataclasses import dataclass
+
+from functions.data_processing import clean_string, round_two_decimals
+
+
+FuelTypeName = Annotated[str, StringConstraints(
+    min_length=1,
+    max_length=50,
+    pattern=r"^[-a-zA-Z0-9 /]+$"
+)]
+PerformanceProfileName = Annotated[str, StringConstraints(
+    min_length=2,
+    max_length=255,
+    pattern=r"^[-a-zA-Z0-9 .,()/]+$"
+)]
+AircraftArrangementName = Annotated[str, StringConstraints(
+    min_length=2,
+    max_length=50,
+    pattern=r"^[-a-zA-Z0-9 ]+$"
+), AfterValidator(clean_string)]
+AircraftModel = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    min_length=2,
+    max_length=50,
+    pattern=r"^[-.a-zA-Z0-9() ]+$"
+)]
+AircraftMake = Annotated[AircraftModel, AfterValidator(clean_string)]
+AircraftCode = Annotated[str, StringConstraints(
+    to_upper=True,
+    strip_whitespace=True,
+    min_length=2,
+    max_length=10,
+    pattern=r"^[-a-zA-Z0-9]+$"
+)]
+WeightBalanceName = Annotated[str, StringConstraints(
+    min_length=2,
+    max_length=50,
+    pattern=r"^[-a-zA-Z0-9() ]+$"
+), AfterValidator(clean_string)]
+
+# Non-negative floats, by number of integer digits, rounded to 2 decimal places
+TwoDigitFloat = Annotated[
+    float, Field(ge=0, le=99.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
+ThreeDigitFloat = Annotated[
+    float, Field(ge=0, le=999.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
+FourDigitFloat = Annotated[
+    float, Field(ge=0, le=9999.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
+FiveDigitFloat = Annotated[
+    float, Field(ge=0, le=99999.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
 
 
 class FuelTypeData(BaseModel):
@@ -20,26 +81,12 @@ class FuelTypeData(BaseModel):
     Schema that outlines the data required to create/edit a fuel type
     """
 
-    name: constr(
-        min_length=1,
-        max_length=50,
-        pattern="^[-a-zA-Z0-9 /]+$"
-    )
-    density_lb_gal: confloat(gt=0, le=99.94, allow_inf_nan=False)
-
-    @field_validator('density_lb_gal')
-    @classmethod
-    def round_density(cls, value: float) -> float:
-        """
-        Classmethod to round density_lb_gal input value to 2 decimal places.
-
-        Parameters:
-        - value (float): the density to be validated.
-
-        Returns:
-        (float): density value rounded to 2 decimal places.
-        """
-        return round(value, 2)
+    name: FuelTypeName
+    density_lb_gal: Annotated[
+        float,
+        Field(gt=0, le=99.94, allow_inf_nan=False),
+        AfterValidator(round_two_decimals)
+    ]
 
 
 class FuelTypeReturn(FuelTypeData):
@@ -47,7 +94,7 @@ class FuelTypeReturn(FuelTypeData):
     Schema that outlines the fuel type data to return to the client
     """
 
-    id: conint(gt=0)
+    id: PositiveInt
 
 
 class PerformanceProfileData(BaseModel):
@@ -55,12 +102,8 @@ class PerformanceProfileData(BaseModel):
     Schema that outlines the data reuired
     to create a new aircraft performance profile
     """
-    fuel_type_id: conint(gt=0)
-    performance_profile_name: constr(
-        min_length=2,
-        max_length=255,
-        pattern="^[a-zA-Z0-9\s.,()/\-]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
+    fuel_type_id: PositiveInt
+    performance_profile_name: PerformanceProfileName
 
 
 class OfficialPerformanceProfileData(PerformanceProfileData):
@@ -72,63 +115,45 @@ class OfficialPerformanceProfileData(PerformanceProfileData):
     is_complete: bool
 
 
-class PerformanceProfileReturn(OfficialPerformanceProfileData):
+class GetPerformanceProfileList(OfficialPerformanceProfileData):
     """
-    Schema that outlines the aircraft performance profile data to return to the client
+    Schema that outlines the aircraft performance profile data to return
+    a list of aircraft performance profiles to the client
     """
-
-    id: conint(gt=0)
-    center_of_gravity_in: Optional[confloat(ge=0, le=9999.94)] = None
-    empty_weight_lb: Optional[confloat(ge=0, le=99999.94)] = None
-    max_ramp_weight_lb: Optional[confloat(ge=0, le=99999.94)] = None
-    max_takeoff_weight_lb: Optional[confloat(ge=0, le=99999.94)] = None
-    max_landing_weight_lb: Optional[confloat(ge=0, le=99999.94)] = None
-    baggage_allowance_lb: Optional[confloat(ge=0, le=9999.94)] = None
+    id: PositiveInt
     is_preferred: Optional[bool] = None
     created_at_utc: AwareDatetime
     last_updated_utc: AwareDatetime
 
 
-class BaggageCompartmentData(BaseModel):
+class PerformanceProfileReturn(GetPerformanceProfileList):
     """
-    Schema that outlines the data required to create/edit an aircraft baggage compartment
+    Schema that outlines the aircraft performance profile data to return to the client
     """
 
-    name: constr(
-        min_length=2,
-        max_length=50,
-        pattern="^[\-a-zA-Z0-9 ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-    arm_in: confloat(ge=0, le=9999.94)
-    weight_limit_lb: Optional[confloat(ge=0, le=9999.94)] = None
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_values_clean_name(cls, values: Dict[str, Any]) -> Dict:
-        """
-        Classmethod to round weight data and clean name.
-
-        Parameters:
-        - values (Dict): dictionary with the input values.
+    center_of_gravity_in: Optional[FourDigitFloat] = None
+    empty_weight_lb: Optional[FiveDigitFloat] = None
+    max_ramp_weight_lb: Optional[FiveDigitFloat] = None
+    max_takeoff_weight_lb: Optional[FiveDigitFloat] = None
+    max_landing_weight_lb: Optional[FiveDigitFloat] = None
+    baggage_allowance_lb: Optional[FourDigitFloat] = None
 
-        Returns:
-        (Dict): dictionary with the input values corrected.
 
-        """
-
-        values.arm_in = round(values.arm_in, 2)
-        values.weight_limit_lb = round(values.weight_limit_lb, 2)\
-            if values.weight_limit_lb is not None else None
-        values.name = clean_string(values.name)
+class BaggageCompartmentData(BaseModel):
+    """
+    Schema that outlines the data required to create/edit an aircraft baggage compartment
+    """
 
-        return values
+    name: AircraftArrangementName
+    arm_in: FourDigitFloat
+    weight_limit_lb: Optional[FourDigitFloat] = None
 
 
 class BaggageCompartmentReturn(BaggageCompartmentData):
     """
     Schema that outlines the aircraft baggage compartment data to return to the client
     """
-    id: conint(gt=0)
+    id: PositiveInt
 
 
 class FuelTankData(BaseModel):
@@ -136,44 +161,18 @@ class FuelTankData(BaseModel):
     Schema that outlines the data required to create/edit an aircraft fuel tank
     """
 
-    name: constr(
-        min_length=2,
-        max_length=50,
-        pattern="^[\-a-zA-Z0-9 ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-    arm_in: confloat(ge=0, le=9999.94)
-    fuel_capacity_gallons: confloat(ge=0, le=999.94)
-    unusable_fuel_gallons: Optional[confloat(ge=0, le=999.94)] = None
-    burn_sequence: Optional[conint(ge=1)] = None
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_values_clean_name(cls, values: Dict[str, Any]) -> Dict:
-        """
-        Classmethod to round float data and clean name.
-
-        Parameters:
-        - values (Dict): dictionary with the input values.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-
-        values.arm_in = round(values.arm_in, 2)
-        values.fuel_capacity_gallons = round(values.fuel_capacity_gallons, 2)
-        values.unusable_fuel_gallons = round(values.unusable_fuel_gallons, 2)\
-            if values.unusable_fuel_gallons is not None else None
-        values.name = clean_string(values.name)
-
-        return values
+    name: AircraftArrangementName
+    arm_in: FourDigitFloat
+    fuel_capacity_gallons: ThreeDigitFloat
+    unusable_fuel_gallons: Optional[ThreeDigitFloat] = None
+    burn_sequence: Optional[PositiveInt] = None
 
 
 class FuelTankReturn(FuelTankData):
     """
     Schema that outlines the aircraft fuel tank data to return to the client
     """
-    id: conint(gt=0)
+    id: PositiveInt
 
 
 class SeatRowData(BaggageCompartmentData):
@@ -181,23 +180,23 @@ class SeatRowData(BaggageCompartmentData):
     Schema that outlines the data required to create/edit an aircraft seat row
     """
 
-    number_of_seats: conint(ge=0)
+    number_of_seats: NonNegativeInt
 
 
 class SeatRowReturn(SeatRowData):
     """
     Schema that outlines the aircraft seat row data to return to the client
     """
-    id: conint(gt=0)
+    id: PositiveInt
 
 
 class AircraftArrangementReturn(BaseModel):
     """
     Schema that outlines the aircraft arrangement data to return to the client
     """
-    baggage_compartments: Optional[List[BaggageCompartmentReturn]] = []
-    seat_rows: Optional[List[SeatRowReturn]] = []
-    fuel_tanks: Optional[List[FuelTankReturn]] = []
+    baggage_compartments: List[BaggageCompartmentReturn] = Field(default_factory=list)
+    seat_rows: List[SeatRowReturn] = Field(default_factory=list)
+    fuel_tanks: List[FuelTankReturn] = Field(default_factory=list)
 
 
 class PerformanceProfileWeightBalanceData(BaseModel):
@@ -205,33 +204,12 @@ class PerformanceProfileWeightBalanceData(BaseModel):
     Schema that outlines the data required to edit the weight and balance data,
     of an aircraft performance profile
     """
-    center_of_gravity_in: confloat(ge=0, le=9999.94)
-    empty_weight_lb: confloat(ge=0, le=99999.94)
-    max_ramp_weight_lb: confloat(ge=0, le=99999.94)
-    max_takeoff_weight_lb: confloat(ge=0, le=99999.94)
-    max_landing_weight_lb: confloat(ge=0, le=99999.94)
-    baggage_allowance_lb: confloat(ge=0, le=9999.94)
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_weight_and_cog(cls, values: Dict[str, Any]) -> Dict:
-        """
-        Classmethod to round weight data.
-
-        Parameters:
-        - values (Dict): dictionary with the input values.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-
-        values.center_of_gravity_in = round(values.center_of_gravity_in, 2)
-        values.empty_weight_lb = round(values.empty_weight_lb, 2)
-        values.max_ramp_weight_lb = round(values.max_ramp_weight_lb, 2)
-        values.max_landing_weight_lb = round(values.max_landing_weight_lb, 2)
-        values.baggage_allowance_lb = round(values.baggage_allowance_lb, 2)
-        return values
+    center_of_gravity_in: FourDigitFloat
+    empty_weight_lb: FiveDigitFloat
+    max_ramp_weight_lb: FiveDigitFloat
+    max_takeoff_weight_lb: FiveDigitFloat
+    max_landing_weight_lb: FiveDigitFloat
+    baggage_allowance_lb: FourDigitFloat
 
 
 class AircraftData(BaseModel):
@@ -239,47 +217,10 @@ class AircraftData(BaseModel):
     Schema that outlines the data required to create/edit an aircraft
     """
 
-    make: constr(
-        strip_whitespace=True,
-        min_length=2,
-        max_length=50,
-        pattern="^[\.\-a-zA-Z0-9\(\) ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-    model: constr(
-        strip_whitespace=True,
-        min_length=2,
-        max_length=50,
-        pattern="^[\.\-a-zA-Z0-9\(\) ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-    abbreviation: constr(
-        to_upper=True,
-        strip_whitespace=True,
-        min_length=2,
-        max_length=10,
-        pattern="^[\-a-zA-Z0-9]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-    registration: constr(
-        to_upper=True,
-        strip_whitespace=True,
-        min_length=2,
-        max_length=10,
-        pattern="^[\-a-zA-Z0-9]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-
-    @field_validator('make')
-    @classmethod
-    def clean_make(cls, value: str) -> str:
-        """
-        Classmethod to clean make.
-
-        Parameters:
-        - value (string): Make.
-
-        Returns:
-        - value (string): clean Make value.
-
-        """
-        return clean_string(value)
+    make: AircraftMake
+    model: AircraftModel
+    abbreviation: AircraftCode
+    registration: AircraftCode
 
 
 class AircraftReturn(AircraftData):
@@ -287,18 +228,7 @@ class AircraftReturn(AircraftData):
     Schema that outlines the aircraft data to return to the client
     """
 
-    id: conint(gt=0)
-    created_at_utc: AwareDatetime
-    last_updated_utc: AwareDatetime
-
-
-class GetPerformanceProfileList(OfficialPerformanceProfileData):
-    """
-    Schema that outlines the aircraft performance profile data to return
-    a list of aircraft performance profiles to the client
-    """
-    id: conint(gt=0)
-    is_preferred: Optional[bool] = None
+    id: PositiveInt
     created_at_utc: AwareDatetime
     last_updated_utc: AwareDatetime
 
@@ -309,7 +239,7 @@ class GetAircraftList(AircraftReturn):
     the client
     """
 
-    profiles: Optional[List[GetPerformanceProfileList]] = []
+    profiles: List[GetPerformanceProfileList] = Field(default_factory=list)
 
 
 class WeightBalanceLimitData(BaseModel):
@@ -318,28 +248,9 @@ class WeightBalanceLimitData(BaseModel):
     and balance profile
     """
 
-    cg_location_in: confloat(ge=0, le=9999.94)
-    weight_lb: confloat(ge=0, le=99999.94)
-    sequence: conint(ge=1)
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_values(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Classmethod to round values.
-
-        Parameters:
-        - values (Dict): dictionary with the input values.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-
-        values.cg_location_in = round(values.cg_location_in, 2)
-        values.weight_lb = round(values.weight_lb, 2)
-
-        return values
+    cg_location_in: FourDigitFloat
+    weight_lb: FiveDigitFloat
+    sequence: PositiveInt
 
 
 class WeightBalanceLimitReturn(WeightBalanceLimitData):
@@ -347,7 +258,7 @@ class WeightBalanceLimitReturn(WeightBalanceLimitData):
     Schema that outlines the weight and balance profile limits' data to 
     return to the client
     """
-    id: conint(gt=0)
+    id: PositiveInt
 
 
 class WeightBalanceData(BaseModel):
@@ -355,27 +266,8 @@ class WeightBalanceData(BaseModel):
     Schema that outlines the data required to crate/edit a weight and balance profile
     """
 
-    name: constr(
-        min_length=2,
-        max_length=50,
-        pattern="^[\-a-zA-Z0-9\(\) ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
-    limits: List[WeightBalanceLimitData] = []
-
-    @field_validator('name')
-    @classmethod
-    def clean_name(cls, value: str) -> str:
-        """
-        Classmethod to clean name.
-
-        Parameters:
-        - values (Dict): dictionary with the input values.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-        return clean_string(value)
+    name: WeightBalanceName
+    limits: List[WeightBalanceLimitData] = Field(default_factory=list)
 
 
 class WeightBalanceReturn(BaseModel):
@@ -384,8 +276,8 @@ class WeightBalanceReturn(BaseModel):
     return to the client
     """
     name: str
-    id: conint(gt=0)
-    limits: List[WeightBalanceLimitReturn] = []
+    id: PositiveInt
+    limits: List[WeightBalanceLimitReturn] = Field(default_factory=list)
     created_at_utc: AwareDatetime
     last_updated_utc: AwareDatetime
 
@@ -395,7 +287,7 @@ class GetWeightBalanceData(PerformanceProfileWeightBalanceData):
     Schema that outlines all the weight and balance data of an aircraft 
     performance profile to return to the client
     """
-    weight_balance_profiles: Optional[List[WeightBalanceReturn]] = []
+    weight_balance_profiles: List[WeightBalanceReturn] = Field(default_factory=list)
 
 
 class RunwaySurfacePercentIncrease(BaseModel):
@@ -404,23 +296,8 @@ class RunwaySurfacePercentIncrease(BaseModel):
     performance percentage increase, by runway surface
     """
 
-    surface_id: conint(gt=0)
-    percent: confloat(ge=0, le=99.94)
-
-    @field_validator('percent')
-    @classmethod
-    def round_percentage(cls, value: float) -> float:
-        """
-        Classmethod to round percentages.
-
-        Parameters:
-        - value (float): percentage adjustment.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-        return round(value, 2)
+    surface_id: PositiveInt
+    percent: TwoDigitFloat
 
 
 class RunwayDistanceAdjustmentPercentages(BaseModel):
@@ -429,48 +306,29 @@ class RunwayDistanceAdjustmentPercentages(BaseModel):
     data to return to the client
     """
 
-    percent_decrease_knot_headwind: Optional[confloat(ge=0, le=99.94)] = None
-    percent_increase_knot_tailwind: Optional[confloat(ge=0, le=99.94)] = None
-    percent_increase_runway_surfaces: Optional[
-        List[RunwaySurfacePercentIncrease]
-    ] = []
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_percentage_adjustments(cls, values: Dict[str, Any]) -> Dict:
-        """
-        Classmethod to round percentages.
-
-        Parameters:
-        - values (Dict): dictionary with the input values.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-
-        if values.percent_decrease_knot_headwind is not None:
-            values.percent_decrease_knot_headwind = round(
-                values.percent_decrease_knot_headwind, 2)
-
-        if values.percent_increase_knot_tailwind is not None:
-            values.percent_increase_knot_tailwind = round(
-                values.percent_increase_knot_tailwind, 2)
-
-        return values
+    percent_decrease_knot_headwind: Optional[TwoDigitFloat] = None
+    percent_increase_knot_tailwind: Optional[TwoDigitFloat] = None
+    percent_increase_runway_surfaces: List[RunwaySurfacePercentIncrease] = Field(
+        default_factory=list
+    )
 
 
-class TakeoffLandingPerformanceDataEntry(BaseModel):
+@dataclass(config=ConfigDict(frozen=True), kw_only=True)
+class TakeoffLandingPerformanceDataEntry:
     """
     Schema that outlines the data required to create an entry of
     an aircraft takeoff/landing performance table
     """
 
-    weight_lb: conint(ge=0)
-    pressure_alt_ft: conint(ge=0)
+    weight_lb: NonNegativeInt
+    pressure_alt_ft: NonNegativeInt
     temperature_c: int
-    groundroll_ft: conint(ge=0)
-    obstacle_clearance_ft: conint(ge=0)
+    groundroll_ft: NonNegativeInt
+    obstacle_clearance_ft: NonNegativeInt
+
+
+# Validates a whole takeoff/landing performance table in one call
+TAKEOFF_LANDING_PERFORMANCE_DATA_LIST = TypeAdapter(List[TakeoffLandingPerformanceDataEntry])
 
 
 class TakeoffLandingPerformanceReturn(RunwayDistanceAdjustmentPercentages):
@@ -486,64 +344,31 @@ class ClimbPerformanceAdjustments(BaseModel):
     Schema that outlines the data required to edit the climb performance adjustmnet values
     """
 
-    take_off_taxi_fuel_gallons: Optional[confloat(ge=0, le=99.94)] = None
-    percent_increase_climb_temperature_c: Optional[confloat(
-        ge=0, le=99.94)] = None
+    take_off_taxi_fuel_gallons: Optional[TwoDigitFloat] = None
+    percent_increase_climb_temperature_c: Optional[TwoDigitFloat] = None
 
-    @model_validator(mode='after')
-    @classmethod
-    def round_data(cls, values: Dict[str, Any]) -> Dict:
-        """
-        Classmethod to round percentages.
 
-        Parameters:
-        - values (Dict): dictionary with the input values.
-
-        Returns:
-        (Dict): dictionary with the input values corrected.
-
-        """
-
-        if values.take_off_taxi_fuel_gallons is not None:
-            values.take_off_taxi_fuel_gallons = round(
-                values.take_off_taxi_fuel_gallons, 2)
-
-        if values.percent_increase_climb_temperature_c is not None:
-            values.percent_increase_climb_temperature_c = round(
-                values.percent_increase_climb_temperature_c, 2)
-
-        return values
-
-
-class ClimbPerformanceDataEntry(BaseModel):
+@dataclass(config=ConfigDict(frozen=True), kw_only=True)
+class ClimbPerformanceDataEntry:
     """
     Schema that outlines the data required to create an entry of
     an aircraft climb performance table
     """
+    # Schema fields, not object state
+    # pylint: disable=too-many-instance-attributes
 
-    weight_lb: conint(ge=0)
-    pressure_alt_ft: conint(ge=0)
+    weight_lb: NonNegativeInt
+    pressure_alt_ft: NonNegativeInt
     temperature_c: int
-    kias: Optional[conint(ge=0)] = None
-    fpm: Optional[conint(ge=0)] = None
-    time_min: conint(ge=0)
-    fuel_gal: confloat(ge=0, le=99.94)
-    distance_nm: conint(ge=0)
-
-    @field_validator('fuel_gal')
-    @classmethod
-    def round_percentage_adjustments(cls, value: float) -> float:
-        """
-        Classmethod to round fuel burn.
-
-        Parameters:
-        - value (float): fuel burn.
+    kias: Optional[NonNegativeInt] = None
+    fpm: Optional[NonNegativeInt] = None
+    time_min: NonNegativeInt
+    fuel_gal: TwoDigitFloat
+    distance_nm: NonNegativeInt
 
-        Returns:
-        (float): rounded fuel burn.
 
-        """
-        return round(value, 2)
+# Validates a whole climb performance table in one call
+CLIMB_PERFORMANCE_DATA_LIST = TypeAdapter(List[ClimbPerformanceDataEntry])
 
 
 class ClimbPerformanceReturn(ClimbPerformanceAdjustments):
@@ -554,34 +379,24 @@ class ClimbPerformanceReturn(ClimbPerformanceAdjustments):
     performance_data: List[ClimbPerformanceDataEntry]
 
 
-class CruisePerformanceDataEntry(BaseModel):
+@dataclass(config=ConfigDict(frozen=True), kw_only=True)
+class CruisePerformanceDataEntry:
     """
     Schema that outlines the data required to create an entry of
     an aircraft cruise performance table
     """
 
-    weight_lb: conint(ge=0)
-    pressure_alt_ft: conint(ge=0)
+    weight_lb: NonNegativeInt
+    pressure_alt_ft: NonNegativeInt
     temperature_c: int
-    bhp_percent: conint(ge=0)
-    gph: confloat(ge=0, le=9999.94)
-    rpm: conint(ge=0)
-    ktas: conint(ge=0)
-
-    @field_validator('gph')
-    @classmethod
-    def round_percentage_adjustments(cls, value: float) -> float:
-        """
-        Classmethod to round fuel burn.
-
-        Parameters:
-        - value (float): fuel burn.
+    bhp_percent: NonNegativeInt
+    gph: FourDigitFloat
+    rpm: NonNegativeInt
+    ktas: NonNegativeInt
 
-        Returns:
-        (float): rounded fuel burn.
 
-        """
-        return round(value, 2)
+# Validates a whole cruise performance table in one call
+CRUISE_PERFORMANCE_DATA_LIST = TypeAdapter(List[CruisePerformanceDataEntry])
 
 
 class CruisePerformanceReturn(BaseModel):
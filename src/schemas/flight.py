@@ -7,107 +7,70 @@ Usage:
 - Import the required schema to validate data at the API endpoints.
 """
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
-    conint,
-    constr,
-    confloat,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveInt,
     AwareDatetime,
-    field_validator,
-    model_validator
+    model_validator,
+    StringConstraints
 )
 
+from functions.data_processing import round_two_decimals
+from schemas._common import FlightWaypointCode, LatitudeDirection, LongitudeDirection
 
-class NewFlightWaypointData(BaseModel):
-    """
-    Schema that outlines the data required to create a new flight waypoint
-    """
-    code: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=2,
-        max_length=50,
-        pattern="^[-A-Za-z0-9']+$",
-    )
-    name: constr(min_length=2, max_length=255)
-    lat_degrees: conint(ge=0, le=90)
-    lat_minutes: conint(ge=0, le=59)
-    lat_seconds: Optional[conint(ge=0, le=59)] = None
-    lat_direction: Optional[constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=1,
-        max_length=1,
-        pattern='^[NSns]$'
-    )] = None
-    lon_degrees: conint(ge=0, le=180)
-    lon_minutes: conint(ge=0, le=59)
-    lon_seconds: Optional[conint(ge=0, le=59)] = None
-    lon_direction: Optional[constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=1,
-        max_length=1,
-        pattern='^[EWew]$'
-    )] = None
-    magnetic_variation: Optional[confloat(
-        allow_inf_nan=False, ge=-99.94, le=99.94)] = None
-
-    @field_validator('magnetic_variation')
-    @classmethod
-    def round_magnetic_variation(cls, value: float) -> float | None:
-        """
-        Classmethod to round magnetic_variation input value to 1 decimal place.
 
-        Parameters:
-        - value (float): the values to be validated.
+FlightWaypointName = Annotated[str, StringConstraints(min_length=2, max_length=255)]
+MinutesSeconds = Annotated[int, Field(ge=0, le=59)]
+AltitudeFt = Annotated[int, Field(ge=500, lt=18000)]
 
-        Returns:
-        (float) : The magnetic_variation value rounded to 2 decimal place.
+# Floats rounded to 2 decimal places
+Hours = Annotated[
+    float, Field(ge=0, le=99.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
+SignedTwoDigitFloat = Annotated[
+    float, Field(ge=-99.94, le=99.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
 
-        """
-        if value is not None:
-            return round(value, 2)
 
-        return None
+class NewFlightWaypointData(BaseModel):
+    """
+    Schema that outlines the data required to create a new flight waypoint
+    """
+    code: FlightWaypointCode
+    name: FlightWaypointName
+    lat_degrees: Annotated[int, Field(ge=0, le=89)]
+    lat_minutes: MinutesSeconds
+    lat_seconds: Optional[MinutesSeconds] = None
+    lat_direction: Optional[LatitudeDirection] = None
+    lon_degrees: Annotated[int, Field(ge=0, le=180)]
+    lon_minutes: MinutesSeconds
+    lon_seconds: Optional[MinutesSeconds] = None
+    lon_direction: Optional[LongitudeDirection] = None
+    magnetic_variation: Optional[SignedTwoDigitFloat] = None
 
     @model_validator(mode='after')
     @classmethod
     def validate_waypoint_schema(cls, values):
         """
-        Classmethod to check whether the lattitude is between 
-        89 59 59 S and 90 0 0 N, and the longitude is between 
+        Classmethod to check whether the longitude is between 
         179 59 59 W and 180 0 0 E; as part of the data validation.
+        The latitude range is checked by the lat_degrees constraint.
 
         Raises:
-        ValueError: Whenever the lattitude or longitud values are not within the desired range.
+        ValueError: Whenever the longitud values are not within the desired range.
         """
 
-        err_message = {
-            "lat": "Latitude must be between S89 59 59 and N89 59 59",
-            "lon": "Longitude must be between W179 59 59 and E180 0 0"
-        }
+        if values.lon_degrees < 180:
+            return values
 
-        if values.lat_degrees > 89:
-            raise ValueError(err_message['lat'])
-
-        if (
-            values.lon_direction == 'E' and
-            values.lon_degrees >= 180 and
-            (
-                values.lon_minutes > 0 or
-                values.lon_seconds > 0
-            )
-        ):
-            raise ValueError(err_message['lon'])
-
-        if (
-            values.lon_direction == 'W' and
-            values.lon_degrees > 179
-        ):
-            raise ValueError(err_message['lon'])
+        if values.lon_direction == 'W' or values.lon_minutes > 0 or (values.lon_seconds or 0) > 0:
+            raise ValueError("Longitude must be between W179 59 59 and E180 0 0")
 
         return values
 
@@ -116,7 +79,7 @@ class NewFlightWaypointReturn(NewFlightWaypointData):
     """
     Schema that outlines the flight waypoint data to return to the client
     """
-    id: conint(ge=0)
+    id: NonNegativeInt
     from_user_waypoint: bool
     from_vfr_waypoint: bool
 
@@ -126,14 +89,14 @@ class LegWaypointData(BaseModel):
     Schema that outlines the waypoint data required when adding a new leg to a flight
     """
     new_waypoint: Optional[NewFlightWaypointData] = None
-    existing_waypoint_id: Optional[conint(ge=0)] = None
+    existing_waypoint_id: Optional[NonNegativeInt] = None
 
 
 class NewLegData(LegWaypointData):
     """
     Schema that outlines the data required to add a new leg to a flight
     """
-    sequence: conint(ge=1)
+    sequence: PositiveInt
 
     @model_validator(mode='after')
     @classmethod
@@ -151,25 +114,10 @@ class NewLegData(LegWaypointData):
         return values
 
 
-class LegWeatherData(BaseModel):
+class _WindDataMixin(BaseModel):
     """
-    Schema that outlines the data required to edit a flight-leg's weather data
+    Mixin that adds the wind data validation to the weather schemas
     """
-    temperature_c: int
-    altimeter_inhg: confloat(ge=-99.94, le=99.94)
-    wind_direction: Optional[conint(ge=0, le=360)] = None
-    wind_magnitude_knot: conint(ge=0)
-    temperature_last_updated: Optional[AwareDatetime] = None
-    wind_last_updated: Optional[AwareDatetime] = None
-    altimeter_last_updated: Optional[AwareDatetime] = None
-
-    @field_validator('altimeter_inhg')
-    @classmethod
-    def round_altimeter_inhg(cls, value: float) -> float | None:
-        """
-        Classmethod to round altimeter_inhg input value to 2 decimal place.
-        """
-        return round(value, 2)
 
     @model_validator(mode='after')
     @classmethod
@@ -188,12 +136,27 @@ class LegWeatherData(BaseModel):
         return values
 
 
+class LegWeatherData(_WindDataMixin):
+    """
+    Schema that outlines the data required to edit a flight-leg's weather data
+    """
+    temperature_c: int
+    altimeter_inhg: SignedTwoDigitFloat
+    wind_direction: Optional[Annotated[int, Field(ge=0, le=360)]] = None
+    wind_magnitude_knot: NonNegativeInt
+    temperature_last_updated: Optional[AwareDatetime] = None
+    wind_last_updated: Optional[AwareDatetime] = None
+    altimeter_last_updated: Optional[AwareDatetime] = None
+
+
 class BaseWeatherReportRequestData(BaseModel):
     """
     Schema that outlines the aerodrome data to return to the client, 
     in a list of breifing aerodromes, as part of the detailed flight-data
     """
-    code: str
+    model_config = ConfigDict(frozen=True)
+
+    code: Annotated[str, StringConstraints(min_length=1, max_length=12)]
     distance_from_target_nm: int
 
 
@@ -201,20 +164,20 @@ class NewLegReturn(LegWeatherData):
     """
     Schema that outlines the data to return to the client, after posting new flight-legs
     """
-    id: conint(ge=0)
-    sequence: conint(ge=1)
+    id: NonNegativeInt
+    sequence: PositiveInt
     waypoint: Optional[NewFlightWaypointReturn] = None
-    altitude_ft: conint(ge=500)
-    upper_wind_aerodromes: List[BaseWeatherReportRequestData] = []
-    metar_aerodromes: List[BaseWeatherReportRequestData] = []
-    briefing_aerodromes: List[BaseWeatherReportRequestData] = []
+    altitude_ft: Annotated[int, Field(ge=500)]
+    upper_wind_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
+    metar_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
+    briefing_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
 
 
 class UpdateLegData(LegWeatherData, LegWaypointData):
     """
     Schema that outlines the data required to update a flight leg
     """
-    altitude_ft: conint(ge=500, lt=18000)
+    altitude_ft: AltitudeFt
 
     @model_validator(mode='after')
     @classmethod
@@ -235,9 +198,9 @@ class NewFlightData(BaseModel):
     Schema that outlines the data requiered to create a new flight
     """
     departure_time: AwareDatetime
-    aircraft_id: Optional[conint(gt=0)] = None
-    departure_aerodrome_id: Optional[conint(gt=0)] = None
-    arrival_aerodrome_id: Optional[conint(gt=0)] = None
+    aircraft_id: Optional[PositiveInt] = None
+    departure_aerodrome_id: Optional[PositiveInt] = None
+    arrival_aerodrome_id: Optional[PositiveInt] = None
 
 
 class UpdateFlightData(BaseModel):
@@ -245,35 +208,22 @@ class UpdateFlightData(BaseModel):
     Schema that outlines the data required to update the general flight settings
     """
     departure_time: AwareDatetime
-    bhp_percent: conint(ge=20, le=100)
-    added_enroute_time_hours: confloat(allow_inf_nan=False, ge=0, le=99.94)
-    reserve_fuel_hours: confloat(allow_inf_nan=False, ge=0, le=99.94)
-    contingency_fuel_hours: confloat(allow_inf_nan=False, ge=0, le=99.94)
-    briefing_radius_nm: conint(ge=0, le=50)
-    alternate_radius_nm: conint(ge=0, le=200)
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_fuel(cls, values):
-        """
-        Classmethod to round the fuel values.
-        """
-        values.added_enroute_time_hours = round(
-            values.added_enroute_time_hours, 2)
-        values.reserve_fuel_hours = round(values.reserve_fuel_hours, 2)
-        values.contingency_fuel_hours = round(values.contingency_fuel_hours, 2)
-
-        return values
+    bhp_percent: Annotated[int, Field(ge=20, le=100)]
+    added_enroute_time_hours: Hours
+    reserve_fuel_hours: Hours
+    contingency_fuel_hours: Hours
+    briefing_radius_nm: Annotated[int, Field(ge=0, le=50)]
+    alternate_radius_nm: Annotated[int, Field(ge=0, le=200)]
 
 
 class NewFlightReturn(NewFlightData):
     """
     Schema that outlines the flight data to return to the client after posting a new flight
     """
-    id: conint(gt=0)
+    id: PositiveInt
     departure_aerodrome_is_private: Optional[bool] = None
     arrival_aerodrome_is_private: Optional[bool] = None
-    waypoints: List[str] = []
+    waypoints: List[str] = Field(default_factory=list)
 
 
 class ExtensiveFlightDataReturn(NewFlightData, UpdateFlightData):
@@ -281,74 +231,44 @@ class ExtensiveFlightDataReturn(NewFlightData, UpdateFlightData):
     Schema that outlines the flight data to return a detailed and extensive 
     flight summary to the client
     """
-    id: conint(gt=0)
+    id: PositiveInt
     departure_aerodrome_is_private: Optional[bool] = None
-    departure_taf_aerodromes: List[BaseWeatherReportRequestData] = []
-    departure_metar_aerodromes: List[BaseWeatherReportRequestData] = []
+    departure_taf_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
+    departure_metar_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
     departure_weather: LegWeatherData
     arrival_aerodrome_is_private: Optional[bool] = None
-    arrival_taf_aerodromes: List[BaseWeatherReportRequestData] = []
-    arrival_metar_aerodromes: List[BaseWeatherReportRequestData] = []
+    arrival_taf_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
+    arrival_metar_aerodromes: List[BaseWeatherReportRequestData] = Field(default_factory=list)
     arrival_weather: LegWeatherData
-    legs: List[NewLegReturn] = []
-    briefing_radius_nm: conint(ge=0)
-    alternate_radius_nm: conint(ge=0)
+    legs: List[NewLegReturn] = Field(default_factory=list)
+    briefing_radius_nm: NonNegativeInt
+    alternate_radius_nm: NonNegativeInt
     all_weather_is_official: bool
-    weather_hours_from_etd: conint(ge=-1)
-    alternates: List[BaseWeatherReportRequestData] = []
+    weather_hours_from_etd: Annotated[int, Field(ge=-1)]
+    alternates: List[BaseWeatherReportRequestData] = Field(default_factory=list)
 
 
-class UpdateDepartureArrivalData(BaseModel):
+class UpdateDepartureArrivalData(_WindDataMixin):
     """
     Schema that outlines the data required to update the departure and arrival flight data
     """
-    aerodrome_id: conint(gt=0)
-    wind_direction: Optional[conint(gt=0, le=360)] = None
-    wind_magnitude_knot: conint(ge=0)
+    aerodrome_id: PositiveInt
+    wind_direction: Optional[Annotated[int, Field(gt=0, le=360)]] = None
+    wind_magnitude_knot: NonNegativeInt
     temperature_c: int
-    altimeter_inhg: confloat(ge=-99.94, le=99.94)
+    altimeter_inhg: SignedTwoDigitFloat
     temperature_last_updated: Optional[AwareDatetime] = None
     wind_last_updated: Optional[AwareDatetime] = None
     altimeter_last_updated: Optional[AwareDatetime] = None
 
-    @model_validator(mode='after')
-    @classmethod
-    def validate_wind_data(cls, values):
-        """
-        Classmethod to check that wind direction is provided, if wind magnitud is not zero.
-        """
-
-        if values.wind_magnitude_knot > 0 and values.wind_direction is None:
-            raise ValueError(
-                "Please provide wind direction."
-            )
-        elif values.wind_magnitude_knot == 0 and values.wind_direction is not None:
-            values.wind_direction = None
-
-        return values
-
-    @field_validator('altimeter_inhg')
-    @classmethod
-    def round_altimeter_inhg(cls, value: float) -> float | None:
-        """
-        Classmethod to round altimeter_inhg input value to 2 decimal place.
-        """
-        return round(value, 2)
-
 
 class WaypointsNotUpdatedReturn(BaseModel):
     """
     Schema that outlines the basic data to return the 
     list of flight waypoints that could not be updated
     """
-    waypoint_id: conint(gt=0)
-    code: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=2,
-        max_length=50,
-        pattern="^['-a-zA-Z0-9]+$",
-    )
+    waypoint_id: PositiveInt
+    code: FlightWaypointCode
 
 
 class UpdateWaypointsReturn(BaseModel):
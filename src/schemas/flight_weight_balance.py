@@ -8,17 +8,30 @@ Usage:
 
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
-    conint,
-    constr,
-    confloat,
-    model_validator
+    Field,
+    PositiveInt,
+    model_validator,
+    StringConstraints
 )
 
-from functions.data_processing import clean_string
+from functions.data_processing import clean_string, round_two_decimals
+
+
+OnBoardName = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    strict=True,
+    min_length=2,
+    max_length=255,
+    pattern=r"^[-a-zA-Z0-9' ]+$"
+), AfterValidator(clean_string)]
+OnBoardWeight = Annotated[
+    float, Field(ge=0, le=999.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
 
 
 class PersonOnBoardData(BaseModel):
@@ -26,18 +39,12 @@ class PersonOnBoardData(BaseModel):
     Schema that outlines the data required to add a new person to a flight
     """
 
-    seat_row_id: conint(gt=0)
-    seat_number: conint(gt=0)
-    name: Optional[constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=2,
-        max_length=255,
-        pattern="^[-a-zA-Z0-9' ]+$",
-    )] = None
-    weight_lb: Optional[confloat(allow_inf_nan=False, ge=0, le=999.94)] = None
+    seat_row_id: PositiveInt
+    seat_number: PositiveInt
+    name: Optional[OnBoardName] = None
+    weight_lb: Optional[OnBoardWeight] = None
     is_me: Optional[bool] = None
-    passenger_profile_id: Optional[conint(gt=0)] = None
+    passenger_profile_id: Optional[PositiveInt] = None
 
     @model_validator(mode='after')
     @classmethod
@@ -46,10 +53,8 @@ class PersonOnBoardData(BaseModel):
         Classmethod to check that only 1 out of 3 possible data sources is provided.
         """
 
-        value_list = [values.weight_lb, values.is_me,
-                      values.passenger_profile_id]
-        count_not_none_values = sum(
-            [1 for values in value_list if values is not None])
+        count_not_none_values = (values.weight_lb is not None) + (values.is_me is not None)\
+            + (values.passenger_profile_id is not None)
 
         if count_not_none_values < 1:
             raise ValueError(
@@ -57,12 +62,9 @@ class PersonOnBoardData(BaseModel):
         if count_not_none_values > 1:
             raise ValueError(
                 "Please provide only one source of passenger/crew-member weight.")
-        if values.weight_lb is not None:
-            if values.name is None:
-                raise ValueError(
-                    "Please provide a name for all persons on board.")
-            values.weight_lb = round(values.weight_lb, 2)
-            values.name = clean_string(values.name)
+        if values.weight_lb is not None and values.name is None:
+            raise ValueError(
+                "Please provide a name for all persons on board.")
 
         return values
 
@@ -71,19 +73,13 @@ class PersonOnBoardReturn(BaseModel):
     """"
     Schema that outlines the person-on-board data to return to the client
     """
-    id: conint(gt=0)
-    seat_row_id: conint(gt=0)
-    seat_number: conint(gt=0)
-    name: constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=2,
-        max_length=255,
-        pattern="^[-a-zA-Z0-9' ]+$",
-    )
-    weight_lb: confloat(allow_inf_nan=False, ge=0, le=999.94)
-    user_id: Optional[conint(gt=0)] = None
-    passenger_profile_id: Optional[conint(gt=0)] = None
+    id: int
+    seat_row_id: int
+    seat_number: int
+    name: OnBoardName
+    weight_lb: OnBoardWeight
+    user_id: Optional[int] = None
+    passenger_profile_id: Optional[int] = None
 
 
 class FlightBaggageData(BaseModel):
@@ -91,48 +87,25 @@ class FlightBaggageData(BaseModel):
     Schema that outlines the data required to add luggage to a flight
     """
 
-    baggage_compartment_id: conint(gt=0)
-    name: constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=2,
-        max_length=255,
-        pattern="^[-a-zA-Z0-9' ]+$",
-    )
-    weight_lb: confloat(allow_inf_nan=False, ge=0, le=999.94)
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_weight_and_clean_name(cls, values):
-        """
-        Classmethod to round the weight and clean name string.
-
-        Parameters:
-        - values (Any): input values.
-
-        Returns:
-        (Any): input values with rounded weight and clean name.
-        """
-        values.weight_lb = round(values.weight_lb, 2)
-        values.name = clean_string(values.name)
-
-        return values
+    baggage_compartment_id: PositiveInt
+    name: OnBoardName
+    weight_lb: OnBoardWeight
 
 
 class FlightBaggageReturn(FlightBaggageData):
     """"
     Schema that outlines the luggage data to return to the client
     """
-    id: conint(gt=0)
+    id: int
 
 
 class FlightFuelReturn(BaseModel):
     """"
     Schema that outlines the fuel data to return to the client
     """
-    id: conint(gt=0)
-    fuel_tank_id: conint(gt=0)
-    gallons: confloat(allow_inf_nan=False, ge=0, le=999.94)
+    id: int
+    fuel_tank_id: int
+    gallons: Annotated[float, Field(ge=0, le=999.94, allow_inf_nan=False)]
     weight_lb: float
 
 
@@ -141,4 +114,4 @@ class FuelData(BaseModel):
     Schema that outlines the data required to add fuel to a flight
     """
 
-    gallons: conint(gt=0)
+    gallons: PositiveInt
@@ -7,16 +7,44 @@ Usage:
 - Import the required schema to validate data at the API endpoints.
 """
 
-from typing import Optional, List
+from typing import Annotated, Optional, List
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
-    conint,
-    confloat,
-    constr,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveInt,
     field_validator,
-    model_validator
+    StringConstraints,
+    TypeAdapter
 )
+from pydantic.dataclasses import dataclass
+
+from functions.data_processing import round_two_decimals
+from schemas._common import FlightWaypointCode
+
+
+RunwayDesignator = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    to_upper=True,
+    min_length=2,
+    max_length=3,
+    pattern=r"^[0-3][0-9][RLC]?$"
+)]
+# Names of seat rows, baggage compartments and fuel tanks, the pattern was
+# already enforced when they were stored, so only the length is checked here
+ArrangementName = Annotated[str, StringConstraints(min_length=2, max_length=50)]
+Bearing = Annotated[int, Field(gt=0, le=360)]
+
+# Floats rounded to 2 decimal places
+RoundedFloat = Annotated[float, AfterValidator(round_two_decimals)]
+MagneticVariation = Annotated[
+    float, Field(ge=-99.94, le=99.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
+FuelGallons = Annotated[float, Field(ge=0, allow_inf_nan=False), AfterValidator(round_two_decimals)]
 
 
 class WaypointInNavLog(BaseModel):
@@ -24,16 +52,10 @@ class WaypointInNavLog(BaseModel):
     Schema that outlines the basic waypoint data included in the navigation log
     """
 
-    code: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=2,
-        max_length=50,
-        pattern="^['-a-zA-Z0-9]+$",
-    )
-    name: constr(min_length=2, max_length=255)
-    latitude_degrees: confloat(ge=-90, le=90)
-    longitude_degrees: confloat(gt=-180, le=180)
+    code: FlightWaypointCode
+    name: Annotated[str, StringConstraints(min_length=2, max_length=255)]
+    latitude_degrees: Annotated[float, Field(ge=-90, le=90)]
+    longitude_degrees: Annotated[float, Field(gt=-180, le=180)]
 
 
 class NavigationLogLegResults(BaseModel):
@@ -43,41 +65,28 @@ class NavigationLogLegResults(BaseModel):
     leg_id: int
     from_waypoint: WaypointInNavLog
     to_waypoint: WaypointInNavLog
-    desired_altitude_ft: conint(ge=0)
-    actual_altitud_ft: conint(ge=0)
-    truncated_altitude: conint(ge=0)
-    rpm: conint(gt=0)
+    desired_altitude_ft: NonNegativeInt
+    actual_altitud_ft: NonNegativeInt
+    truncated_altitude: NonNegativeInt
+    rpm: PositiveInt
     temperature_c: int
     truncated_temperature_c: int
-    ktas: conint(ge=0)
-    kcas: conint(ge=0)
-    true_track: conint(gt=0, le=360)
-    wind_magnitude_knot: conint(ge=0)
-    wind_direction: Optional[conint(ge=0, le=360)] = None
-    true_heading: conint(gt=0, le=360)
-    magnetic_variation: confloat(allow_inf_nan=False, ge=-99.94, le=99.94)
+    ktas: NonNegativeInt
+    kcas: NonNegativeInt
+    true_track: Bearing
+    wind_magnitude_knot: NonNegativeInt
+    wind_direction: Optional[Annotated[int, Field(ge=0, le=360)]] = None
+    true_heading: Bearing
+    magnetic_variation: MagneticVariation
     magnetic_heading: int
-    ground_speed: conint(ge=0)
-    distance_to_climb: conint(ge=0)
+    ground_speed: NonNegativeInt
+    distance_to_climb: NonNegativeInt
     distance_enroute: int
-    total_distance: conint(ge=0)
-    time_to_climb_min: conint(ge=0)
-    time_enroute_min: conint(ge=0)
-    fuel_to_climb_gallons: confloat(allow_inf_nan=False, ge=0.0)
-    cruise_gph: confloat(allow_inf_nan=False, ge=0.0)
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_float_data(cls, values):
-        """
-        Classmethod to round floats to 2 decimal places.
-        """
-
-        values.magnetic_variation = round(values.magnetic_variation, 2)
-        values.fuel_to_climb_gallons = round(values.fuel_to_climb_gallons, 2)
-        values.cruise_gph = round(values.cruise_gph, 2)
-
-        return values
+    total_distance: NonNegativeInt
+    time_to_climb_min: NonNegativeInt
+    time_enroute_min: NonNegativeInt
+    fuel_to_climb_gallons: FuelGallons
+    cruise_gph: FuelGallons
 
     @field_validator('magnetic_heading')
     @classmethod
@@ -85,11 +94,11 @@ class NavigationLogLegResults(BaseModel):
         """
         Classmethod to bound magnetic heading values within 0 to 360.
         """
-        if value > 360:
-            value -= 360
-        if value < 0:
-            value += 360
-        return value
+        return value if 0 <= value <= 360 else value % 360
+
+
+# Validates and serializes a whole navigation log in one call
+NAVIGATION_LOG_RESULTS_LIST = TypeAdapter(List[NavigationLogLegResults])
 
 
 class FuelEnduranceAndGallons(BaseModel):
@@ -98,50 +107,47 @@ class FuelEnduranceAndGallons(BaseModel):
     as part of the fuel calculation results
     """
 
-    hours: confloat(ge=0)
-    gallons: confloat(ge=0)
+    hours: NonNegativeFloat
+    gallons: NonNegativeFloat
 
 
 class FuelCalculationResults(BaseModel):
     """
     Schema that outlines the fuel calculations results to return to the client
     """
-    pre_takeoff_gallons: confloat(ge=0)
-    climb_gallons: confloat(ge=0)
-    average_gph: confloat(ge=0)
+    pre_takeoff_gallons: NonNegativeFloat
+    climb_gallons: NonNegativeFloat
+    average_gph: NonNegativeFloat
     enroute_fuel: FuelEnduranceAndGallons
     additional_fuel: FuelEnduranceAndGallons
     reserve_fuel: FuelEnduranceAndGallons
     contingency_fuel: FuelEnduranceAndGallons
-    gallons_on_board: confloat(ge=0)
+    gallons_on_board: NonNegativeFloat
 
 
-class TakeoffLandingDistancesResults(BaseModel):
+@dataclass(config=ConfigDict(frozen=True), kw_only=True, slots=True)
+class TakeoffLandingDistancesResults:
     """
     Schema that outlines the takeoff/landing distance results to return to the client
     """
+    # Schema fields, not object state
+    # pylint: disable=too-many-instance-attributes
 
-    runway_id: conint(gt=0)
-    runway: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=2,
-        max_length=3,
-        pattern="^[0-3][0-9][RLC]?$"
-    )
-    length_available_ft: conint(gt=0)
-    intersection_departure_length: Optional[conint(gt=0)] = None
-    weight_lb: confloat(ge=0)
+    runway_id: int
+    runway: RunwayDesignator
+    length_available_ft: PositiveInt
+    intersection_departure_length: Optional[PositiveInt] = None
+    weight_lb: NonNegativeFloat
     pressure_altitude_ft: int
     truncated_pressure_altitude_ft: int
     temperature_c: int
     truncated_temperature_c: int
     headwind_knot: int
     x_wind_knot: int
-    ground_roll_ft: conint(ge=0)
-    obstacle_clearance_ft: conint(ge=0)
-    adjusted_ground_roll_ft: conint(ge=0)
-    adjusted_obstacle_clearance_ft: conint(ge=0)
+    ground_roll_ft: NonNegativeInt
+    obstacle_clearance_ft: NonNegativeInt
+    adjusted_ground_roll_ft: NonNegativeInt
+    adjusted_obstacle_clearance_ft: NonNegativeInt
 
 
 class TakeoffAndLandingDistances(BaseModel):
@@ -158,20 +164,9 @@ class BaseWeightAndBalanceReportReturn(BaseModel):
     to the client in the  W&B report
     """
 
-    weight_lb: float
-    arm_in: float
-    moment_lb_in: float
-
-    @model_validator(mode='after')
-    @classmethod
-    def round_float_data(cls, values):
-        """
-        Classmethod to round floats to 2 decimal places.
-        """
-        values.weight_lb = round(values.weight_lb, 2)
-        values.arm_in = round(values.arm_in, 2)
-        values.moment_lb_in = round(values.moment_lb_in, 2)
-        return values
+    weight_lb: RoundedFloat
+    arm_in: RoundedFloat
+    moment_lb_in: RoundedFloat
 
 
 class WeightAndBalanceFuelReturn(BaseWeightAndBalanceReportReturn):
@@ -180,15 +175,9 @@ class WeightAndBalanceFuelReturn(BaseWeightAndBalanceReportReturn):
     weight and balance data to the client, as pasrt of the W&B report
     """
 
-    gallons: confloat(allow_inf_nan=False, le=999.94)
-
-    @field_validator('gallons')
-    @classmethod
-    def round_gallons(cls, value: int) -> int:
-        """
-        Classmethod round fuel gallons to 2 decimal places.
-        """
-        return round(value, 2)
+    gallons: Annotated[
+        float, Field(le=999.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+    ]
 
 
 class WeightAndBalanceFuelTankReturn(WeightAndBalanceFuelReturn):
@@ -197,12 +186,8 @@ class WeightAndBalanceFuelTankReturn(WeightAndBalanceFuelReturn):
     to the client, as pasrt of the W&B report
     """
 
-    fuel_tank_id: conint(gt=0)
-    fuel_tank_name: constr(
-        min_length=2,
-        max_length=50,
-        pattern="^[\-a-zA-Z0-9 ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
+    fuel_tank_id: int
+    fuel_tank_name: ArrangementName
 
 
 class WeightAndBalanceSeatRowReturn(BaseWeightAndBalanceReportReturn):
@@ -211,12 +196,8 @@ class WeightAndBalanceSeatRowReturn(BaseWeightAndBalanceReportReturn):
     as part of the  W&B report
     """
 
-    seat_row_id: conint(gt=0)
-    seat_row_name: constr(
-        min_length=2,
-        max_length=50,
-        pattern="^[\-a-zA-Z0-9 ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
+    seat_row_id: int
+    seat_row_name: ArrangementName
 
 
 class WeightAndBalanceBaggageCompartmentReturn(BaseWeightAndBalanceReportReturn):
@@ -224,12 +205,8 @@ class WeightAndBalanceBaggageCompartmentReturn(BaseWeightAndBalanceReportReturn)
     Schema that outlines the baggage compartment data to return to the client, 
     as part of the  W&B report
     """
-    baggage_compartment_id: conint(gt=0)
-    baggage_compartment_name: constr(
-        min_length=2,
-        max_length=50,
-        pattern="^[\-a-zA-Z0-9 ]+$"  # pylint: disable=anomalous-backslash-in-string
-    )
+    baggage_compartment_id: int
+    baggage_compartment_name: ArrangementName
 
 
 class WeightAndBalanceReport(BaseModel):
@@ -237,10 +214,7 @@ class WeightAndBalanceReport(BaseModel):
     Schema that outlines the  W&B report data to return to the client
     """
 
-    warnings: List[constr(
-        strip_whitespace=True,
-        max_length=255
-    )]
+    warnings: List[str]
     seats: List[WeightAndBalanceSeatRowReturn]
     compartments: List[WeightAndBalanceBaggageCompartmentReturn]
     fuel_on_board: List[WeightAndBalanceFuelTankReturn]
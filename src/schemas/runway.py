@@ -8,11 +8,28 @@ Usage:
 
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, constr, conint, field_validator, model_validator, AwareDatetime
+from pydantic import (
+    BaseModel,
+    conint,
+    field_validator,
+    model_validator,
+    AwareDatetime,
+    StringConstraints
+)
 
 from functions.data_processing import clean_string
+from schemas._common import RunwayPosition, RunwaySurfaceName
+
+
+AerodromeCode = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    to_upper=True,
+    min_length=2,
+    max_length=50,
+    pattern=r"^[-a-zA-Z0-9]+$"
+)]
 
 
 class RunwayDataEdit(BaseModel):
@@ -27,12 +44,7 @@ class RunwayDataEdit(BaseModel):
         ge=1,
         le=36
     )
-    position: Optional[constr(
-        to_upper=True,
-        min_length=1,
-        max_length=1,
-        pattern="^[rRlLcC]$"
-    )] = None
+    position: Optional[RunwayPosition] = None
     surface_id: int
 
     @model_validator(mode='after')
@@ -70,20 +82,9 @@ class RunwayReturn(RunwayData):
     Schema that outlines the runway data to return to the client
     """
 
-    id: conint(gt=0)
-    surface: constr(
-        strip_whitespace=True,
-        min_length=2,
-        max_length=50,
-        pattern="^[-a-zA-Z ']+$",
-    )
-    aerodrome: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=2,
-        max_length=50,
-        pattern='^[-a-zA-Z0-9]+$',
-    )
+    id: int
+    surface: RunwaySurfaceName
+    aerodrome: AerodromeCode
     created_at_utc: AwareDatetime
     last_updated_utc: AwareDatetime
 
@@ -93,12 +94,7 @@ class RunwaySurfaceData(BaseModel):
     Schema that outlines the data required to create a new runway-surface
     """
 
-    surface: constr(
-        strip_whitespace=True,
-        min_length=2,
-        max_length=50,
-        pattern="^[-a-zA-Z ']+$",
-    )
+    surface: RunwaySurfaceName
 
     @field_validator('surface')
     @classmethod
@@ -121,4 +117,4 @@ class RunwaySurfaceReturn(RunwaySurfaceData):
     Schema that outlines the runway-surface data to return to the client
     """
 
-    id: conint(gt=0)
+    id: int
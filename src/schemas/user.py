@@ -8,11 +8,37 @@ Usage:
 
 """
 
-from typing import List
-
-from pydantic import BaseModel, constr, EmailStr, conint, confloat, field_validator, AwareDatetime
-
-from functions.data_processing import clean_string
+from typing import Annotated, List
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    EmailStr,
+    Field,
+    field_validator,
+    AwareDatetime,
+    StringConstraints
+)
+
+from functions.data_processing import clean_string, round_two_decimals
+
+
+ProfileName = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    strict=True,
+    min_length=2,
+    max_length=255,
+    pattern=r"^[A-Za-z0-9 /.'-]+$"
+)]
+Password = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    strict=True,
+    min_length=8,
+    max_length=25
+)]
+PersonWeight = Annotated[
+    float, Field(ge=0, le=999.94, allow_inf_nan=False), AfterValidator(round_two_decimals)
+]
 
 
 class PassengerProfileData(BaseModel):
@@ -20,14 +46,8 @@ class PassengerProfileData(BaseModel):
     Schema that outlines the data required to create a new passenger profile
     """
 
-    name: constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=2,
-        max_length=255,
-        pattern="^[A-Za-z0-9 /.'-]+$",
-    )
-    weight_lb: confloat(allow_inf_nan=False, ge=0, le=999.94)
+    name: ProfileName
+    weight_lb: PersonWeight
 
     @field_validator('name')
     @classmethod
@@ -44,28 +64,13 @@ class PassengerProfileData(BaseModel):
         """
         return clean_string(value)
 
-    @field_validator('weight_lb')
-    @classmethod
-    def round_user_weight(cls, value: float) -> float:
-        """
-        Classmethod to round weight_lb input value to 1 decimal place.
-
-        Parameters:
-        - value (float): the weight to be validated.
-
-        Returns:
-        (float): weight value rounded to 2 decimal place.
-
-        """
-        return round(value, 2)
-
 
 class PassengerProfileReturn(PassengerProfileData):
     """
     Schema that outlines the passenger profile data to return to the client
     """
 
-    id: conint(gt=0)
+    id: int
 
 
 class UserEmail(BaseModel):
@@ -81,13 +86,7 @@ class UserName(BaseModel):
     Schema that outlines the name data to register, update and return a user
     """
 
-    name: constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=2,
-        max_length=255,
-        pattern="^[A-Za-z0-9 /.'-]+$",
-    )
+    name: ProfileName
 
     @field_validator('name')
     @classmethod
@@ -110,14 +109,16 @@ class UserReturnBasic(UserName, UserEmail):
     Schema that outlines the most basic user data to return to the client
     """
 
-    id: conint(gt=0)
+    # Emails from the database were validated as EmailStr on registration
+    email: str
+    id: int
     is_admin: bool
     is_master: bool
     is_active: bool
     is_trial: bool
     created_at: AwareDatetime
     last_updated: AwareDatetime
-    weight_lb: confloat(ge=0, le=999.94)
+    weight_lb: PersonWeight
 
 
 class UserReturn(UserReturnBasic):
@@ -131,12 +132,7 @@ class UserPassword(BaseModel):
     """
     Schema that outlines defines the user password data structure
     """
-    password: constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=8,
-        max_length=25
-    )
+    password: Password
 
     @field_validator('password')
     @classmethod
@@ -152,19 +148,27 @@ class UserPassword(BaseModel):
         (string):password after validation is complete.
         """
 
-        if any(c.isspace() or c == '\n' for c in password):
-            raise ValueError(
-                "Password cannot contain any white spaces or line breaks.")
-
-        if not any(c.isupper() for c in password):
+        has_upper = has_lower = has_digit = False
+        for c in password:
+            if c.isspace():
+                raise ValueError(
+                    "Password cannot contain any white spaces or line breaks.")
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+
+        if not has_upper:
             raise ValueError(
                 "Password must have at least one uppercase character.")
 
-        if not any(c.islower() for c in password):
+        if not has_lower:
             raise ValueError(
                 "Password must have at least one lowercase character.")
 
-        if not any(c.isdigit() for c in password):
+        if not has_digit:
             raise ValueError("Password must have at least one digit.")
 
         return password
@@ -174,22 +178,7 @@ class UserWeight(BaseModel):
     """
     Schema that outlines the user weight data
     """
-    weight_lb: confloat(ge=0, le=999.94)
-
-    @field_validator('weight_lb')
-    @classmethod
-    def round_user_weight(cls, value: float) -> float:
-        """
-        Classmethod to round weight_lb input value to 1 decimal place.
-
-        Parameters:
-        - value (float): the weight to be validated.
-
-        Returns:
-        (float): weight value rounded to 2 decimal place.
-
-        """
-        return round(value, 2)
+    weight_lb: PersonWeight
 
 
 class UserRegister(UserPassword, UserName, UserEmail):
@@ -208,12 +197,7 @@ class PasswordChangeData(UserPassword):
     """
     Schema that outlines the data required to change a user's password
     """
-    current_password: constr(
-        strip_whitespace=True,
-        strict=True,
-        min_length=8,
-        max_length=25
-    )
+    current_password: Password
 
 
 class JWTData(BaseModel):
@@ -228,6 +212,7 @@ class TokenData(BaseModel):
     """
     Schema that outlines the JWT payload
     """
+    user_id: int
     email: str | None = None
     is_admin: bool
     is_master: bool
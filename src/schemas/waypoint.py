@@ -8,20 +8,42 @@ Usage:
 
 """
 
-from typing import Optional
+from typing import Annotated, List, Optional
 
 from pydantic import (
     BaseModel,
-    constr,
+    ConfigDict,
+    Field,
     conint,
     confloat,
-    conlist,
     AwareDatetime,
     field_validator,
-    model_validator
+    model_validator,
+    StringConstraints
 )
+from pydantic.dataclasses import dataclass
 
 from functions.data_processing import clean_string
+from schemas._common import (
+    LatitudeDirection,
+    LongitudeDirection,
+    RunwayPosition,
+    RunwaySurfaceName
+)
+
+
+WaypointCode = Annotated[str, StringConstraints(
+    strip_whitespace=True,
+    to_upper=True,
+    min_length=2,
+    max_length=12,
+    pattern=r"^['a-zA-Z0-9-]+$"
+)]
+WaypointName = Annotated[str, StringConstraints(min_length=2, max_length=50)]
+
+_LATITUDE_ERROR = "Latitude must be between S89 59 59 and N89 59 59"
+_LONGITUDE_ERROR = "Longitude must be between W179 59 59 and E180 0 0"
+_MAX_LONGITUDE_SECONDS = 180 * 3600
 
 
 class WaypointBase(BaseModel):
@@ -29,34 +51,16 @@ class WaypointBase(BaseModel):
     Schema that outlines the basic waypoint data required to create, edit or return waypoints
     """
 
-    code: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=2,
-        max_length=12,
-        pattern="^['a-zA-Z0-9-]+$",
-    )
-    name: constr(min_length=2, max_length=50)
+    code: WaypointCode
+    name: WaypointName
     lat_degrees: conint(ge=0, le=90)
     lat_minutes: conint(ge=0, le=59)
     lat_seconds: Optional[conint(ge=0, le=59)] = None
-    lat_direction: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=1,
-        max_length=1,
-        pattern='^[NSns]$'
-    )
+    lat_direction: LatitudeDirection
     lon_degrees: conint(ge=0, le=180)
     lon_minutes: conint(ge=0, le=59)
     lon_seconds: Optional[conint(ge=0, le=59)] = None
-    lon_direction: constr(
-        strip_whitespace=True,
-        to_upper=True,
-        min_length=1,
-        max_length=1,
-        pattern='^[EWew]$'
-    )
+    lon_direction: LongitudeDirection
     magnetic_variation: Optional[confloat(
         allow_inf_nan=False, ge=-99.94, le=99.94)] = None
 
@@ -65,16 +69,13 @@ class UserWaypointReturn(WaypointBase):
     """
     Schema that outlines the user-waypoint data to return to the client
     """
+    model_config = ConfigDict(from_attributes=True)
 
     id: conint(gt=0)
-    name: Optional[constr(min_length=2, max_length=50)] = None
+    name: Optional[WaypointName] = None
     created_at_utc: AwareDatetime
     last_updated_utc: AwareDatetime
 
-    class Config():
-        "Confirgaration parameters."
-        from_attributes = True
-
 
 class VfrWaypointReturn(UserWaypointReturn):
     """
@@ -93,7 +94,7 @@ class UserWaypointData(WaypointBase):
     @classmethod
     def round_magnetic_variation(cls, value: float) -> float:
         """
-        Classmethod to round magnetic_variation input value to 1 decimal place.
+        Classmethod to round magnetic_variation input value to 2 decimal places.
         """
         if value is None:
             return None
@@ -105,7 +106,7 @@ class UserWaypointData(WaypointBase):
         """
         Classmethod to clean name string.
         """
-        return None if value is None else clean_string(value)
+        return clean_string(value) if value else None
 
     @model_validator(mode='after')
     @classmethod
@@ -116,29 +117,14 @@ class UserWaypointData(WaypointBase):
         179 59 59 W and 180 0 0 E; as part of the data validation.
         """
 
-        err_message = {
-            "lat": "Latitude must be between S89 59 59 and N89 59 59",
-            "lon": "Longitude must be between W179 59 59 and E180 0 0"
-        }
-
         if values.lat_degrees > 89:
-            raise ValueError(err_message['lat'])
-
-        if (
-            values.lon_direction == 'E' and
-            values.lon_degrees >= 180 and
-            (
-                values.lon_minutes > 0 or
-                values.lon_seconds > 0
-            )
-        ):
-            raise ValueError(err_message['lon'])
-
-        if (
-            values.lon_direction == 'W' and
-            values.lon_degrees > 179
-        ):
-            raise ValueError(err_message['lon'])
+            raise ValueError(_LATITUDE_ERROR)
+
+        # E180 0 0 is the eastern limit, and W179 59 59 is one second short of it
+        lon_total_seconds = values.lon_degrees * 3600 + \
+            values.lon_minutes * 60 + (values.lon_seconds or 0)
+        if lon_total_seconds > _MAX_LONGITUDE_SECONDS - (values.lon_direction == 'W'):
+            raise ValueError(_LONGITUDE_ERROR)
 
         return values
 
@@ -203,21 +189,11 @@ class RunwayInAerodromeReturn(BaseModel):
         ge=1,
         le=36
     )
-    position: Optional[constr(
-        to_upper=True,
-        min_length=1,
-        max_length=1,
-        pattern="^[rRlLcC]$"
-    )] = None
+    position: Optional[RunwayPosition] = None
     length_ft: int
     landing_length_ft: Optional[int] = None
     intersection_departure_length_ft: Optional[int] = None
-    surface: constr(
-        strip_whitespace=True,
-        min_length=2,
-        max_length=50,
-        pattern="^[-a-zA-Z ']+$",
-    )
+    surface: RunwaySurfaceName
     surface_id: int
     created_at_utc: AwareDatetime
     last_updated_utc: AwareDatetime
@@ -250,10 +226,11 @@ class AerodromeReturnWithRunways(RegisteredAerodromeReturn):
     Schema that outlines the aerodrome data to return to the 
     client, including the list of runways
     """
-    runways: Optional[conlist(item_type=RunwayInAerodromeReturn)] = []
+    runways: List[RunwayInAerodromeReturn] = Field(default_factory=list)
 
 
-class AerodromeStatusReturn(BaseModel):
+@dataclass(config=ConfigDict(frozen=True), kw_only=True, slots=True)
+class AerodromeStatusReturn:
     """
     Schema that outlines the aerodrome-status data to return to the client
     """
@@ -8,6 +8,8 @@ Usage:
 
 """
 
+from functools import lru_cache
+
 from fastapi import FastAPI, status, HTTPException, Request
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.responses import HTMLResponse
@@ -20,9 +22,9 @@ def add_documentation(app: FastAPI):
     """
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
-    @app.get("/docs", include_in_schema=False)
-    def overridden_swagger(req: Request) -> HTMLResponse:
-        root_path = req.scope.get("root_path", "").rstrip("/")
+    # The docs page only depends on the root path, so it's rendered once per root path
+    @lru_cache(maxsize=8)
+    def swagger_html(root_path: str) -> bytes:
         openapi_url = root_path + app.openapi_url
         oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
         if oauth2_redirect_url:
@@ -34,7 +36,11 @@ def add_documentation(app: FastAPI):
             init_oauth=app.swagger_ui_init_oauth,
             swagger_favicon_url="/static/logo.png",
             swagger_ui_parameters=app.swagger_ui_parameters,
-        )
+        ).body
+
+    @app.get("/docs", include_in_schema=False)
+    def overridden_swagger(req: Request) -> HTMLResponse:
+        return HTMLResponse(swagger_html(req.scope.get("root_path", "").rstrip("/")))
 
     @app.get("/redoc", include_in_schema=False)
     def overridden_redoc():
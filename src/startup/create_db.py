@@ -11,6 +11,7 @@ import sys
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import OperationalError, TimeoutError as SqlalchemyTimeoutError
+from sqlalchemy.pool import NullPool
 
 from utils import environ_variable_tools as environ
 
@@ -32,7 +33,8 @@ def create_database() -> None:
     """
 
     print("------ CREATING DATABSE ------")
-    temp_engine = create_engine(TEMP_DB_URL)
+    # One-off engine, so its connection is closed instead of kept in a pool
+    temp_engine = create_engine(TEMP_DB_URL, poolclass=NullPool)
 
     try:
         with temp_engine.connect() as connection:
@@ -41,3 +43,5 @@ def create_database() -> None:
     except (SqlalchemyTimeoutError, OperationalError) as error:
         print(f"Fatal Error! Could not create database: {error}")
         sys.exit(1)
+    finally:
+        temp_engine.dispose()
@@ -12,6 +12,7 @@ import json
 import os
 import re
 import sys
+from dataclasses import asdict
 
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, IntegrityError, TimeoutError as SqlalchemyTimeoutError
@@ -46,6 +47,18 @@ def _create_tables() -> None:
     models.Model.metadata.create_all(bind=engine)
 
 
+def _create_indexes() -> None:
+    """
+    This function creates the indexes that are missing from existing db tables.
+    """
+    try:
+        for table in models.Model.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+    except OperationalError as error:
+        print(f"Error! could not create indexes: {error}")
+
+
 def _create_master_user():
     """
     This function creates the master user.
@@ -519,28 +532,28 @@ def _add_performance_profile_models():
                         # Add takeoff performance data
                         new_takeoff_data = [models.TakeoffPerformance(
                             performance_profile_id=performance_profile_id,
-                            **row.model_dump()
+                            **asdict(row)
                         ) for row in takeoff_data]
                         db_session.add_all(new_takeoff_data)
 
                         # Add landing performance data
                         new_landing_data = [models.LandingPerformance(
                             performance_profile_id=performance_profile_id,
-                            **row.model_dump()
+                            **asdict(row)
                         ) for row in landing_data]
                         db_session.add_all(new_landing_data)
 
                         # Add climb performance data
                         new_climb_data = [models.ClimbPerformance(
                             performance_profile_id=performance_profile_id,
-                            **row.model_dump()
+                            **asdict(row)
                         ) for row in climb_data]
                         db_session.add_all(new_climb_data)
 
                         # Add cruise performance data
                         new_cruise_data = [models.CruisePerformance(
                             performance_profile_id=performance_profile_id,
-                            **row.model_dump()
+                            **asdict(row)
                         ) for row in cruise_data]
                         db_session.add_all(new_cruise_data)
 
@@ -572,4 +585,5 @@ def migrate_db():
     print("--- RUNNING DB MIGRATIONS ---")
     _set_charracter_set()
     _create_tables()
+    _create_indexes()
     _populate_db()
@@ -10,13 +10,23 @@ Usage:
 """
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, delete
 from apscheduler.schedulers.background import BackgroundScheduler
 
 
 import models
 from utils.db import Session
 
+# Age after which a trial account gets deleted
+_TRIAL_ACCOUNT_LIFETIME = timedelta(hours=24)
+
+# Built once, so every run reuses the same statement. The job's session
+# has no loaded users to synchronize with the deleted rows.
+_DELETE_TRIAL_ACCOUNTS = delete(models.User).where(and_(
+    models.User.is_trial.is_(True),
+    models.User.created_at <= bindparam("threshold_datetime")
+)).execution_options(synchronize_session=False)
+
 
 def schedule_clean_db_job():
     """
@@ -29,17 +39,17 @@ def schedule_clean_db_job():
 
     def cleanup_database():
 
-        threshold_datetime = datetime.utcnow() - timedelta(hours=24)
+        threshold_datetime = datetime.utcnow() - _TRIAL_ACCOUNT_LIFETIME
 
-        try:
-            with Session() as db_session:
-                db_session.query(models.User).filter(and_(
-                    models.User.is_trial.is_(True),
-                    models.User.created_at <= threshold_datetime
-                )).delete()
+        with Session() as db_session:
+            try:
+                db_session.execute(
+                    _DELETE_TRIAL_ACCOUNTS,
+                    {"threshold_datetime": threshold_datetime}
+                )
 
                 db_session.commit()
-        except Exception:
-            db_session.rollback()
+            except Exception:
+                db_session.rollback()
 
     scheduler.add_job(cleanup_database, 'interval', hours=12)
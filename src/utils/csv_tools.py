@@ -10,7 +10,7 @@ Usage:
 
 import csv
 import io
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import zipfile
 
 from fastapi import UploadFile, HTTPException, status
@@ -112,24 +112,71 @@ async def extract_data(file: UploadFile) -> List[Dict[str, Any]]:
     return utf8_to_list(utf8_content=content.decode("utf-8"))
 
 
-def zip_csv_files_from_data_list(csv_files_data: List[Dict[str, Any]]):
+def extract_data_sync(file: UploadFile) -> List[Dict[str, Any]]:
+    """
+    This function will extract the data from the csv-file, reading it 
+    synchronously, and return it as a list of dictionaries. 
+    Use it inside sync endpoints, which run in FastAPI's threadpool.
+
+    Parameters:
+    - file(fastapi UploadFile): csv file in memore.
+
+    Returns: 
+    - list: list of dictionaries with the data in the csv file.
+
+    Raise:
+    HTTPException (400): If the data in the file is not in the correct format
+    """
+    return utf8_to_list(utf8_content=file.file.read().decode("utf-8"))
+
+
+class _ZipStream:
+    """
+    Write-only file object that keeps the bytes written by a zipfile.ZipFile,
+    so they can be handed over in chunks while the zip file is being built.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        """
+        Keeps a chunk of data.
+        """
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        """
+        Nothing to flush, the chunks are kept in memory until popped.
+        """
+
+    def pop(self) -> bytes:
+        """
+        Returns all the data written since the last call, and clears it.
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def zip_csv_files_from_data_list(csv_files_data: List[Dict[str, Any]]) -> Iterator[bytes]:
     """
     This function will extract the data from a list of data,
-    and return it as a zip of csv-files.
+    and yield it as a zip of csv-files, one chunk per csv-file.
 
     Parameters:
     - csv_files_data(list[dict]): list of dictionaries with the data.
 
     Returns: 
-    - Any: file buffer.
+    - Iterator[bytes]: chunks of the zip file.
     """
 
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w') as zipf:
+    zip_stream = _ZipStream()
+    with zipfile.ZipFile(zip_stream, 'w', compression=zipfile.ZIP_STORED) as zipf:
         for csv_file_data in csv_files_data:
             csv_content = list_to_buffer(csv_file_data["data"])
             zipf.writestr(csv_file_data["name"], csv_content.getvalue())
+            yield zip_stream.pop()
 
-    zip_buffer.seek(0)
-
-    return zip_buffer
+    yield zip_stream.pop()
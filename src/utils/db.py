@@ -30,7 +30,15 @@ DB_HOST = environ.get('db_host')
 DB_PORT = environ.get('db_port')
 DB_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_engine(DB_URL, echo=False)
+# Sync endpoints run in FastAPI's threadpool (40 workers by default), so the
+# pool is sized to give every worker a connection without waiting on checkout.
+engine = create_engine(
+    DB_URL,
+    echo=False,
+    pool_size=20,
+    max_overflow=20,
+    pool_recycle=3600
+)
 
 Session = sessionmaker(
     autocommit=False,